@@ -1,78 +1,127 @@
 #!/usr/bin/env python3
 
+import math
+
 import numpy as np
+try:
+    from numba import njit
+except ModuleNotFoundError:
+    def njit(*args, **kwargs):
+        return lambda func: func
 
 from pysisyphus.calculators.Calculator import Calculator
 
+
+_A  = np.array((-200, -100, -170, 15), dtype=np.float64)
+_X0 = np.array((1.0, 0.0, -0.5, -1.0))
+_Y0 = np.array((0.0, 0.5, 1.5, 1.0))
+_a  = np.array((-1.0, -1.0, -6.5, 0.7))
+_b  = np.array((0.0, 0.0, 11.0, 0.6))
+_c  = np.array((-10.0, -10.0, -6.5, 0.7))
+
+
+@njit(cache=True, fastmath=True)
+def _mb_energy(x, y):
+    energy = 0.0
+    for i in range(4):
+        dx = x - _X0[i]
+        dy = y - _Y0[i]
+        energy += _A[i] * math.exp(_a[i]*dx*dx + _b[i]*dx*dy + _c[i]*dy*dy)
+    return energy
+
+
+@njit(cache=True, fastmath=True)
+def _mb_gradient(x, y):
+    dVdx = 0.0
+    dVdy = 0.0
+    for i in range(4):
+        dx = x - _X0[i]
+        dy = y - _Y0[i]
+        exp = _A[i] * math.exp(_a[i]*dx*dx + _b[i]*dx*dy + _c[i]*dy*dy)
+        dVdx += (2*_a[i]*dx + _b[i]*dy) * exp
+        dVdy += (_b[i]*dx + 2*_c[i]*dy) * exp
+    return dVdx, dVdy
+
+
+@njit(cache=True, fastmath=True)
+def _mb_hessian(x, y):
+    dVdxdx = 0.0
+    dVdxdy = 0.0
+    dVdydy = 0.0
+    for i in range(4):
+        dx = x - _X0[i]
+        dy = y - _Y0[i]
+        exp = _A[i] * math.exp(_a[i]*dx*dx + _b[i]*dx*dy + _c[i]*dy*dy)
+        gx = 2*_a[i]*dx + _b[i]*dy
+        gy = _b[i]*dx + 2*_c[i]*dy
+        dVdxdx += (gx*gx + 2*_a[i]) * exp
+        dVdxdy += (gx*gy + _b[i]) * exp
+        dVdydy += (gy*gy + 2*_c[i]) * exp
+    return dVdxdx, dVdxdy, dVdydy
+
+
+def _mb_exp_terms(x, y):
+    """Broadcasting NumPy variant; returns the per-term quantities with the
+    four terms along the last axis."""
+    dx = np.asarray(x, dtype=float)[..., None] - _X0
+    dy = np.asarray(y, dtype=float)[..., None] - _Y0
+    exp = _A * np.exp(_a*dx*dx + _b*dx*dy + _c*dy*dy)
+    gx = 2*_a*dx + _b*dy
+    gy = _b*dx + 2*_c*dy
+    return exp, gx, gy
+
+
 class MullerBrownPot(Calculator):
 
-    def __init__(self): 
+    def __init__(self):
         super(MullerBrownPot, self).__init__()
 
 
     def get_energy(self, atoms, coords):
         x, y, z = coords
 
-        A  = (-200, -100, -170, 15)
-        x0 = (1.0, 0.0, -0.5, -1.0)
-        y0 = (0.0, 0.5, 1.5, 1.0)
-        a  = (-1.0, -1.0, -6.5, 0.7)
-        b  = (0.0, 0.0, 11.0, 0.6)
-        c  = (-10.0, -10.0, -6.5, 0.7)
-
-        energy = 0
-        for i in range(4):
-            energy += (A[i] * np.exp(
-                        a[i] * (x - x0[i])**2 +
-                        b[i] * (x - x0[i]) * (y - y0[i]) +
-                        c[i] * (y - y0[i])**2
-                      )
-            )
+        if np.ndim(x) == 0:
+            return {"energy": _mb_energy(float(x), float(y))}
+
+        # Supports array-valued x and y, e.g. a whole grid for plotting.
+        dx = np.asarray(x)[..., None] - _X0
+        dy = np.asarray(y)[..., None] - _Y0
+        energy = (_A * np.exp(_a*dx*dx + _b*dx*dy + _c*dy*dy)).sum(axis=-1)
         return {"energy": energy}
 
     def get_forces(self, atoms, coords):
         x, y, z = coords
-        A  = (-200, -100, -170, 15)
-        x0 = (1.0, 0.0, -0.5, -1.0)
-        y0 = (0.0, 0.5, 1.5, 1.0)
-        a  = (-1.0, -1.0, -6.5, 0.7)
-        b  = (0.0, 0.0, 11.0, 0.6)
-        c  = (-10.0, -10.0, -6.5, 0.7)
-
-        forces = 0
-        dx = 0
-        dy = 0
-        for i in range(4):
-            dx += (A[i] *
-                    (2*a[i]*(x - x0[i]) + b[i]*(y - y0[i])) *
-                    np.exp(
-                        a[i] * (x - x0[i])**2 +
-                        b[i] * (x - x0[i]) * (y - y0[i]) +
-                        c[i] * (y - y0[i])**2
-                    )
-            )
-            dy += (A[i] *
-                    (b[i]*(x - x0[i]) + 2*c[i]*(y - y0[i])) *
-                    np.exp(
-                        a[i] * (x - x0[i])**2 +
-                        b[i] * (x - x0[i]) * (y - y0[i]) +
-                        c[i] * (y - y0[i])**2
-                    )
-            )
-        dz = np.zeros_like(dx)
-        forces = -np.stack((dx, dy, dz), axis=-1)
+        if np.ndim(x) == 0:
+            dVdx, dVdy = _mb_gradient(float(x), float(y))
+            forces = -np.array((dVdx, dVdy, 0.))
+        else:
+            exp, gx, gy = _mb_exp_terms(x, y)
+            dVdx = (gx * exp).sum(axis=-1)
+            dVdy = (gy * exp).sum(axis=-1)
+            forces = -np.stack((dVdx, dVdy, np.zeros_like(dVdx)), axis=-1)
 
         results = self.get_energy(atoms, coords)
         results["forces"] = forces
         return results
 
-    """
     def get_hessian(self, atoms, coords):
         x, y, z = coords
-        self._hessian = ((12*x**2 + 2 - 4*y, -4*x-2),
-                         (-4*x-2, 4)
-        )
-    """
+        if np.ndim(x) == 0:
+            dVdxdx, dVdxdy, dVdydy = _mb_hessian(float(x), float(y))
+            hessian = np.array(
+                ((dVdxdx, dVdxdy, 0), (dVdxdy, dVdydy, 0), (0, 0, 0))
+            )
+        else:
+            exp, gx, gy = _mb_exp_terms(x, y)
+            hessian = np.zeros(exp.shape[:-1] + (3, 3))
+            hessian[..., 0, 0] = ((gx*gx + 2*_a) * exp).sum(axis=-1)
+            hessian[..., 0, 1] = ((gx*gy + _b) * exp).sum(axis=-1)
+            hessian[..., 1, 0] = hessian[..., 0, 1]
+            hessian[..., 1, 1] = ((gy*gy + 2*_c) * exp).sum(axis=-1)
+
+        results = self.get_energy(atoms, coords)
+        results["hessian"] = hessian
+        return results
 
     def __str__(self):
         return "Müller-Brown-Potential"
@@ -0,0 +1,28 @@
+import importlib.util
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+
+def load_mb_pot():
+    fn = Path(__file__).parents[2] / "calculators" / "MullerBrownPot.py"
+    spec = importlib.util.spec_from_file_location("MullerBrownPot", fn)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.MullerBrownPot
+
+
+@pytest.mark.parametrize("method", ("get_energy", "get_forces", "get_hessian"))
+def test_array_coords(method):
+    calc = load_mb_pot()()
+    xs = np.linspace(-1.5, 1.0, 4)
+    ys = np.linspace(-0.5, 2.0, 3)
+    X, Y = np.meshgrid(xs, ys)
+    coords = np.stack((X, Y, np.zeros_like(X)))
+
+    key = method.split("_")[1]
+    results = getattr(calc, method)(None, coords)[key]
+    for ind in np.ndindex(X.shape):
+        ref = getattr(calc, method)(None, coords[(slice(None), *ind)])[key]
+        np.testing.assert_allclose(results[ind], ref)
@@ -12,6 +12,10 @@ from scipy.spatial.distance import pdist
 from scipy.spatial.transform import Rotation
 import rmsd
 
+try:
+    import xxhash
+except ModuleNotFoundError:
+    xxhash = None
 try:
     from thermoanalysis.QCData import QCData
     from thermoanalysis.thermo import thermochemistry
@@ -244,6 +248,8 @@ class Geometry:
         self._energy = None
         self._forces = None
         self._hessian = None
+        # Key of the coordinates, the stored results belong to.
+        self._results_key = None
         self.calculator = None
 
         assert (
@@ -628,9 +634,10 @@ class Geometry:
         coords.reshape(-1, 3)[self.freeze_atoms] = self.coords3d[self.freeze_atoms]
         # Set new Cartesian coordinates
         self._coords = coords
-        # Reset all values because no calculations with the new coords
-        # have been performed yet.
-        self.clear()
+        # Reset all values when no calculations with the new coords have been
+        # performed yet. Results are kept when identical coordinates are set again.
+        if self._results_key != self._coords_key():
+            self.clear()
 
     def reset_coords(self, new_typed_prims=None):
         if self.coord_type == "cart":
@@ -714,7 +721,7 @@ class Geometry:
             pass
 
         # Prepend (new) energy, if present
-        if self._energy:
+        if self._energy is not None:
             en_str = f"{self._energy: >{en_width}.8f} , "
         else:
             en_str = ""
@@ -893,6 +900,25 @@ class Geometry:
             reparametrized = False
         return reparametrized
 
+    def _coords_key(self):
+        """Key of the current Cartesian coordinates, used for cache validation.
+
+        Uses the fast xxh3 hash when the optional xxhash package is available."""
+        if xxhash is not None:
+            return xxhash.xxh3_64_intdigest(np.ascontiguousarray(self._coords))
+        return hash(self._coords.tobytes())
+
+    def _store_results_key(self):
+        self._results_key = self._coords_key()
+
+    def _validate_results(self):
+        """Drop stored results when the coordinates were modified in place,
+        e.g., via 'geom.coords3d[...] = ...', after the results were set."""
+        if (self._results_key is not None) and (
+            self._results_key != self._coords_key()
+        ):
+            self.clear()
+
     @property
     def energy(self):
         """Energy of the current atomic configuration.
@@ -902,6 +928,7 @@ class Geometry:
         energy : float
             Energy of the current atomic configuration.
         """
+        self._validate_results()
         if self._energy is None:
             results = self.calculator.get_energy(self.atoms, self._coords)
             self.set_results(results)
@@ -915,10 +942,13 @@ class Geometry:
         ----------
         energy : float
         """
+        self._validate_results()
         self._energy = energy
+        self._store_results_key()
 
     @property
     def cart_forces(self):
+        self._validate_results()
         if self._forces is None:
             results = self.calculator.get_forces(self.atoms, self._coords)
             self.set_results(results)
@@ -928,7 +958,9 @@ class Geometry:
     def cart_forces(self, cart_forces):
         cart_forces = np.array(cart_forces)
         assert cart_forces.shape == self.cart_coords.shape
+        self._validate_results()
         self._forces = cart_forces
+        self._store_results_key()
 
     @property
     def forces(self):
@@ -955,7 +987,9 @@ class Geometry:
         """
         forces = np.array(forces)
         assert forces.shape == self.cart_coords.shape
+        self._validate_results()
         self._forces = forces
+        self._store_results_key()
 
     @property
     def cart_gradient(self):
@@ -995,6 +1029,7 @@ class Geometry:
 
     @property
     def cart_hessian(self):
+        self._validate_results()
         if self._hessian is None:
             results = self.calculator.get_hessian(self.atoms, self._coords)
             self.set_results(results)
@@ -1005,7 +1040,9 @@ class Geometry:
         if cart_hessian is not None:
             cart_hessian = np.array(cart_hessian)
             assert cart_hessian.shape == (self.cart_coords.size, self.cart_coords.size)
+        self._validate_results()
         self._hessian = cart_hessian
+        self._store_results_key()
 
     @property
     def hessian(self):
@@ -1213,6 +1250,7 @@ class Geometry:
         self._energy = None
         self._forces = None
         self._hessian = None
+        self._results_key = None
         self.true_energy = None
         self.true_forces = None
         self.true_hessian = None
@@ -1240,6 +1278,9 @@ class Geometry:
             "all_energies": "all_energies",
         }
 
+        # Drop stale results before any of the new ones are set, so that
+        # e.g. true_energy is not cleared by a later energy setter.
+        self._validate_results()
         for key in results:
             # Zero forces of frozen atoms
             if key == "forces":
@@ -12,6 +12,10 @@ from pysisyphus.plotters.AnimPlot import AnimPlot
 
 
 class AnaPotBase(Calculator):
+    # Lambdified potentials and derivatives, shared by all instances with the
+    # same V_str, so the sympy work is only done once.
+    _lambdified = dict()
+
     def __init__(
         self,
         V_str,
@@ -38,24 +42,19 @@ class AnaPotBase(Calculator):
             saddles = list()
         self.saddles = np.array(saddles, dtype=float)
 
-        x, y = symbols("x y")
-        if use_sympify:
-            V = sympify(V_str)
-        else:
-            V = V_str
-        dVdx = diff(V, x)
-        dVdy = diff(V, y)
-        self.V = lambdify((x, y), V, "numpy")
-        self.dVdx = lambdify((x, y), dVdx, "numpy")
-        self.dVdy = lambdify((x, y), dVdy, "numpy")
-
-        dVdxdx = diff(V, x, x)
-        dVdxdy = diff(V, x, y)
-        dVdydy = diff(V, y, y)
-
-        self.dVdxdx = lambdify((x, y), dVdxdx, "numpy")
-        self.dVdxdy = lambdify((x, y), dVdxdy, "numpy")
-        self.dVdydy = lambdify((x, y), dVdydy, "numpy")
+        try:
+            funcs = self._lambdified[V_str]
+        except KeyError:
+            funcs = self.lambdify_potential(V_str, use_sympify)
+            self._lambdified[V_str] = funcs
+        (
+            self.V,
+            self.dVdx,
+            self.dVdy,
+            self.dVdxdx,
+            self.dVdxdy,
+            self.dVdydy,
+        ) = funcs
 
         self.fake_atoms = ("X",)  # X, dummy atom
 
@@ -71,6 +70,23 @@ class AnaPotBase(Calculator):
         self.fig = None
         self.ax = None
 
+    @staticmethod
+    def lambdify_potential(V_str, use_sympify=True):
+        x, y = symbols("x y")
+        if use_sympify:
+            V = sympify(V_str)
+        else:
+            V = V_str
+        exprs = (
+            V,
+            diff(V, x),
+            diff(V, y),
+            diff(V, x, x),
+            diff(V, x, y),
+            diff(V, y, y),
+        )
+        return tuple([lambdify((x, y), expr, "numpy") for expr in exprs])
+
     def get_energy(self, atoms, coords):
         self.energy_calcs += 1
         x, y, z = coords
@@ -4,7 +4,7 @@ import sys
 
 from distributed import Client
 import numpy as np
-from scipy.interpolate import interp1d, splprep, splev
+from scipy.interpolate import CubicSpline, interp1d
 
 from pysisyphus.helpers import align_coords, get_coords_diffs
 from pysisyphus.helpers_pure import hash_arr
@@ -176,6 +176,16 @@ class ChainOfStates:
         """Distribute the flat 1d coords array over all images."""
         self.set_vector("coords", coords, clear=True)
 
+    @property
+    def coords2d(self):
+        """Return a 2d array of shape (nimages, coords_length) containing
+        the coordinates of all images. Requires the same number of coordinates
+        for all images."""
+        coords2d = np.empty((len(self.images), self.coords_length))
+        for i, image in enumerate(self.images):
+            coords2d[i] = image.coords
+        return coords2d
+
     @property
     def cart_coords(self):
         """Return a flat 1d array containing the cartesian coordinates of all
@@ -310,9 +320,7 @@ class ChainOfStates:
 
     @property
     def perpendicular_forces(self):
-        indices = range(len(self.images))
-        perp_forces = [self.get_perpendicular_forces(i) for i in indices]
-        return np.array(perp_forces).flatten()
+        return self.get_perpendicular_forces_all().flatten()
 
     def get_perpendicular_forces(self, i):
         """[1] Eq. 12"""
@@ -328,6 +336,29 @@ class ChainOfStates:
         perp_forces = forces - forces.dot(tangent) * tangent
         return perp_forces
 
+    def get_perpendicular_forces_all(self):
+        """Perpendicular forces of all images as 2d array.
+
+        Equivalent to calling get_perpendicular_forces() for every image,
+        but the projection is done for all moving images at once."""
+        perp_forces = np.zeros((len(self.images), self.coords_length))
+        moving_indices = self.moving_indices
+        forces = np.reshape(
+            [self.images[i].forces for i in moving_indices], (-1, self.coords_length)
+        )
+        tangents = np.reshape(self.get_tangents(), (-1, self.coords_length))[
+            moving_indices
+        ]
+        # Row-wise dot products of forces and tangents, without forming the
+        # elementwise product first.
+        dots = np.einsum("ij,ij->i", forces, tangents)
+        # 'forces' and 'tangents' are fresh arrays, so the parallel components
+        # can be formed and removed in place, without any temporary array.
+        tangents *= dots[:, None]
+        forces -= tangents
+        perp_forces[moving_indices] = forces
+        return perp_forces
+
     @property
     def gradient(self):
         return -self.forces
@@ -626,48 +657,16 @@ class ChainOfStates:
         hei_energy = energies_fine[hei_ind]
 
         reshaped = cart_coords.reshape(-1, self.cart_coords_length)
-        # To use splprep we have to transpose the coords.
-        transp_coords = reshaped.transpose()
-        tcks, us = zip(
-            *[
-                splprep(transp_coords[i : i + 9], s=0, k=3, u=coord_diffs)
-                for i in range(0, len(transp_coords), 9)
-            ]
-        )
-
-        # Reparametrize mesh
-        hei_coords = np.vstack(
-            [
-                # WTF, Black? This looks horrible.
-                splev(
-                    [
-                        hei_x,
-                    ],
-                    tck,
-                )
-                for tck in tcks
-            ]
-        )
-        hei_coords = hei_coords.flatten()
+        # Interpolating cubic spline with not-a-knot conditions, as done by
+        # splprep(..., s=0, k=3), but for all coordinates at once.
+        spline = CubicSpline(coord_diffs, reshaped, axis=0, bc_type="not-a-knot")
+        hei_coords = spline(hei_x)
 
         # Actually it looks like that splined tangents are really bad approximations
         # to the actual imaginary mode. The Cartesian upwinding tangent is usually
         # much much better. In 'run_tsopt_from_cos' we actually mix two "normal" tangents
         # to obtain the HEI tangent.
-        hei_tangent = np.vstack(
-            [
-                # WTF, Black? This looks horrible.
-                splev(
-                    [
-                        hei_x,
-                    ],
-                    tck,
-                    der=1,
-                )
-                for tck in tcks
-            ]
-        ).T
-        hei_tangent = hei_tangent.flatten()
+        hei_tangent = spline(hei_x, 1)
         hei_tangent /= np.linalg.norm(hei_tangent)
         return hei_coords, hei_energy, hei_tangent, hei_frac_index
 
@@ -1,5 +1,5 @@
 import numpy as np
-from scipy.interpolate import splprep, splev
+from scipy.interpolate import CubicSpline
 
 from pysisyphus.constants import AU2KJPERMOL
 from pysisyphus.intcoords.exceptions import (
@@ -85,11 +85,19 @@ class GrowingString(GrowingChainOfStates):
         self.new_image_inds = list()
 
     def get_cur_param_density(self, kind=None):
-        diffs = [
-            image - self.images[max(i - 1, 0)] for i, image in enumerate(self.images)
-        ]
-
-        norms = np.linalg.norm(diffs, axis=1)
+        if self.coord_type == "cart":
+            # Cartesian differences between neighbouring images can be calculated
+            # in one go from the stacked coordinates. The first image has no
+            # predecessor, so its difference is zero.
+            coords = self.coords2d
+            norms = np.zeros(len(self.images))
+            norms[1:] = np.linalg.norm(np.diff(coords, axis=0), axis=1)
+        else:
+            diffs = [
+                image - self.images[max(i - 1, 0)]
+                for i, image in enumerate(self.images)
+            ]
+            norms = np.linalg.norm(diffs, axis=1)
         param_density = np.cumsum(norms)
         self.log(f"Current string length={param_density[-1]:.6f}")
 
@@ -257,35 +265,32 @@ class GrowingString(GrowingChainOfStates):
     def image_inds(self):
         return self.full_string_image_inds
 
-    def spline(self, tangents=False):
-        if (not tangents) and (self.param == "energy") and self.fully_grown:
+    def spline(self):
+        if (self.param == "energy") and self.fully_grown:
             u = self.get_cur_param_density(kind="energy")
         else:
             u = self.get_cur_param_density()
-        reshaped = self.coords.reshape(-1, self.coords_length)
-        # To use splprep we have to transpose the coords.
-        transp_coords = reshaped.transpose()
-        # Spline in batches as scipy can't handle > 11 rows at once
-        tcks, us = zip(
-            *[
-                splprep(transp_coords[i : i + 9], s=0, k=3, u=u)
-                for i in range(0, len(transp_coords), 9)
-            ]
-        )
-        return tcks, us
+        # The energy weighted density is None, as long as energies are not
+        # available for all images. Use the normalized arclength then.
+        if u is None:
+            u = self.get_cur_param_density()
+        # Interpolating cubic spline with not-a-knot conditions, as done by
+        # splprep(..., s=0, k=3), but for all coordinates at once.
+        spline = CubicSpline(u, self.coords2d, axis=0, bc_type="not-a-knot")
+        return spline
 
     def reparam_cart(self, desired_param_density):
-        tcks, us = self.spline()
-        # Reparametrize mesh
-        new_points = np.vstack([splev(desired_param_density, tck) for tck in tcks])
-        # Flatten along first dimension.
-        new_points = new_points.reshape(-1, len(self.images)).T
+        spline = self.spline()
+        # Reparametrize mesh; new_points has shape (nimages, coords_length).
+        new_points = spline(desired_param_density)
+        assert new_points.shape == (len(self.images), self.coords_length)
         # With a climbing image we ignore the just splined coordinates for the CI
         # and restore its original coordinates.
         for index in self.get_climbing_indices():
             new_points[index] = self.images[index].coords
             self.log(f"Skipped reparametrization of climbing image with index {index}")
-        self.coords = new_points.flatten()
+        # new_points is C-contiguous, so ravel() returns a view and no copy is made.
+        self.coords = new_points.ravel()
         # In contrast to self.reparam_dlc() we don't check if the reparametrization
         # succeeded because it can't fail ;)
 
@@ -296,44 +301,54 @@ class GrowingString(GrowingChainOfStates):
         # is above or below the desired param_density on the normalized arc.
         #
         # The reparametrization is done in micro cycles, until it is converged.
+        # In every micro cycle all unconverged images are shifted, based on the
+        # same parametrization density, which is only recomputed afterwards.
         cur_param_density = self.get_cur_param_density()
         self.log(f"Density before reparametrization: {cur_param_density}")
-        for i, reparam_image in enumerate(self.images[1:-1], 1):
-            if i in climbing_indices:
-                self.log(f"Skipped reparametrization of climbing image with index {i}")
-                continue
-            self.log(f"Reparametrizing node {i}")
-            for j in range(self.max_micro_cycles):
-                diff = (desired_param_density - cur_param_density)[i]
-                self.log(f"\t{j}: Δ={diff: .6f}")
-                # Do at least one pass
-                if (j > 0) and (abs(diff) < thresh):
-                    break
-                # Negative sign: image is too far right and has to be shifted left.
-                # Positive sign: image is too far left and has to be shifted right.
-                sign = int(np.sign(diff))
-                # Index of the tangent image. reparam_image will be shifted along
-                # this direction to achieve the desired parametirzation density.
-                tangent_ind = i + sign
-                tangent_image = self.images[tangent_ind]
-                rl = "right" if sign > 0 else "left"
-                self.log(f"\t... shifting {rl} towards image {tangent_ind}")
-                distance = -(reparam_image - tangent_image)
-
-                param_dens_diff = abs(
-                    cur_param_density[tangent_ind] - cur_param_density[i]
-                )
-                step_length = abs(diff) / param_dens_diff
+        for i in climbing_indices:
+            self.log(f"Skipped reparametrization of climbing image with index {i}")
+        reparam_inds = np.array(
+            [i for i in range(1, len(self.images) - 1) if i not in climbing_indices],
+            dtype=int,
+        )
+        for j in range(self.max_micro_cycles):
+            diffs = (desired_param_density - cur_param_density)[reparam_inds]
+            abs_diffs = np.abs(diffs)
+            diffs_str = np.array2string(diffs, precision=6)
+            self.log(f"\t{j}: Δ={diffs_str}")
+            # Do at least one pass
+            if (j > 0) and (abs_diffs < thresh).all():
+                break
+            to_shift = (abs_diffs > 0.0) if j == 0 else (abs_diffs >= thresh)
+            shift_inds = reparam_inds[to_shift]
+            # Negative sign: image is too far right and has to be shifted left.
+            # Positive sign: image is too far left and has to be shifted right.
+            signs = np.sign(diffs[to_shift]).astype(int)
+            # Indices of the tangent images. The images will be shifted along
+            # these directions to achieve the desired parametirzation density.
+            tangent_inds = shift_inds + signs
+            param_dens_diffs = np.abs(
+                cur_param_density[tangent_inds] - cur_param_density[shift_inds]
+            )
+            step_lengths = abs_diffs[to_shift] / param_dens_diffs
+            for i, tangent_ind, step_length in zip(
+                shift_inds, tangent_inds, step_lengths
+            ):
+                reparam_image = self.images[i]
+                rl = "right" if tangent_ind > i else "left"
+                self.log(f"\t... shifting node {i} {rl} towards image {tangent_ind}")
+                # Distances are calculated in the DLCs of reparam_image, so they
+                # can't be stacked and are determined image by image.
+                distance = -(reparam_image - self.images[tangent_ind])
                 step = step_length * distance
                 reparam_coords = reparam_image.coords + step
                 self.set_coords(reparam_image, reparam_coords)
-                cur_param_density = self.get_cur_param_density()
-            else:
-                self.log(
-                    f"Reparametrization of node {i} did not converge after "
-                    f"{self.max_micro_cycles} cycles. Breaking!"
-                )
-                break
+            cur_param_density = self.get_cur_param_density()
+        else:
+            self.log(
+                f"Reparametrization did not converge after "
+                f"{self.max_micro_cycles} cycles."
+            )
 
         cpd_str = np.array2string(cur_param_density, precision=4)
         self.log(f"Param density after reparametrization: {cpd_str}")
@@ -380,15 +395,60 @@ class GrowingString(GrowingChainOfStates):
 
         return tangent
 
+    def get_tangents(self):
+        """Tangents of all images as 2d array.
+
+        For Cartesian strings all tangents are calculated in one vectorized pass,
+        yielding the same tangents as calling get_tangent() for every image."""
+        if (self.coord_type != "cart") or self.started_climbing_lanczos:
+            return super().get_tangents()
+
+        nimages = len(self.images)
+        coords = self.coords2d
+        energies = np.array([image.energy for image in self.images])
+        inds = np.arange(nimages)
+        prev_inds = np.maximum(inds - 1, 0)
+        next_inds = np.minimum(inds + 1, nimages - 1)
+        # Zero for the first and last image, respectively.
+        tangents_plus = coords[next_inds] - coords
+        tangents_minus = coords - coords[prev_inds]
+
+        # Upwinding tangents, see ChainOfStates.get_tangent()
+        prev_energies = energies[prev_inds]
+        next_energies = energies[next_inds]
+        next_energy_diffs = np.abs(next_energies - energies)
+        prev_energy_diffs = np.abs(prev_energies - energies)
+        delta_energies_max = np.maximum(next_energy_diffs, prev_energy_diffs)[:, None]
+        delta_energies_min = np.minimum(next_energy_diffs, prev_energy_diffs)[:, None]
+        uphill = (next_energies > energies) & (energies > prev_energies)
+        downhill = (next_energies < energies) & (energies < prev_energies)
+        next_higher = next_energies >= prev_energies
+        tangents = np.where(
+            next_higher[:, None],
+            tangents_plus * delta_energies_max + tangents_minus * delta_energies_min,
+            tangents_plus * delta_energies_min + tangents_minus * delta_energies_max,
+        )
+        tangents[uphill] = tangents_plus[uphill]
+        tangents[downhill] = tangents_minus[downhill]
+        tangents[0] = tangents_plus[0]
+        tangents[-1] = tangents_minus[-1]
+
+        # Simple tangents, pointing at each other, for the frontier images.
+        if not self.fully_grown:
+            tangents[self.lf_ind] = tangents_plus[self.lf_ind]
+            tangents[self.rf_ind] = -tangents_minus[self.rf_ind]
+
+        tangents /= np.linalg.norm(tangents, axis=1)[:, None]
+        return tangents
+
     @ChainOfStates.forces.getter
     def forces(self):
         if self._forces is None:
             self.calculate_forces()
-        indices = range(len(self.images))
         # In constrast to NEB calculations we only use the perpendicular component
         # of the force, without any spring forces. A desired image distribution is
         # achieved via periodic reparametrization.
-        perp_forces = np.array([self.get_perpendicular_forces(i) for i in indices])
+        perp_forces = self.get_perpendicular_forces_all()
         self.perp_forces_list.append(perp_forces.copy().flatten())
         # Add climbing forces
         total_forces = self.set_climbing_forces(perp_forces)
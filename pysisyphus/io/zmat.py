@@ -1,4 +1,7 @@
 from collections import namedtuple
+from dataclasses import dataclass
+import functools
+import math
 
 import numpy as np
 
@@ -11,6 +14,323 @@ ZLine = namedtuple(
 )
 
 
+def _build_coords(rind, aind, dind, r, a_rad, d_rad, coords3d, start_at):
+    """Place the atoms of a z-matrix into coords3d, starting at start_at.
+
+    Angles are expected in radians. Unset parent indices are -1, unset values
+    are NaN."""
+    for k in range(r.size):
+        i = start_at + k
+        # First atom is placed at the origin
+        if i == 0:
+            continue
+        # Bond along x-axis
+        elif i == 1:
+            coords3d[i, 0] = r[k]
+        # Angle in xy-plane from polar coordinates
+        elif i == 2:
+            r"""
+            M       P <- add
+             \     /
+              u   v
+               \ /
+                O
+            """
+            theta = a_rad[k]
+            # Center
+            O = coords3d[rind[k]]
+            # x-component of the bond u, pointing away from O to M
+            u_x = coords3d[aind[k], 0] - O[0]
+            # Direction of u along x axis (left/right). Unlike np.sign this
+            # never yields 0, which would collapse the new atom onto O.
+            sign = math.copysign(1.0, u_x)
+            # Polar coordinates
+            x = r[k] * math.cos(theta)
+            y = r[k] * math.sin(theta)
+            # Translate from center with correct orientation
+            coords3d[i, 0] = O[0] + sign * x
+            coords3d[i, 1] = O[1] + sign * y
+            coords3d[i, 2] = O[2]
+        # Dihedral in xyz-space from spherical coordinates
+        else:
+            theta = a_rad[k]
+            phi = d_rad[k]
+
+            # Scalar math functions; sin and cos of the same angle can be
+            # fused into one sincos call by the compiler.
+            sin_theta = math.sin(theta)
+            cos_theta = math.cos(theta)
+            sin_phi = math.sin(phi)
+            cos_phi = math.cos(phi)
+
+            x = r[k] * cos_theta
+            y = r[k] * sin_theta * cos_phi
+            z = r[k] * sin_theta * sin_phi
+
+            r"""
+            M <- add      N
+             \           /
+              u         v
+               \       /
+                O--w--P
+            """
+
+            O = coords3d[rind[k]]
+            P = coords3d[aind[k]]
+            N = coords3d[dind[k]]
+
+            # Local axis system, kept in scalars so no temporary arrays are
+            # created. The cross products are written out explicitly.
+            vx = P[0] - N[0]
+            vy = P[1] - N[1]
+            vz = P[2] - N[2]
+            inv = 1.0 / math.sqrt(vx * vx + vy * vy + vz * vz)
+            vx *= inv
+            vy *= inv
+            vz *= inv
+            wx = O[0] - P[0]
+            wy = O[1] - P[1]
+            wz = O[2] - P[2]
+            inv = 1.0 / math.sqrt(wx * wx + wy * wy + wz * wz)
+            wx *= inv
+            wy *= inv
+            wz *= inv
+            # a = v x w
+            ax = vy * wz - vz * wy
+            ay = vz * wx - vx * wz
+            az = vx * wy - vy * wx
+            inv = 1.0 / math.sqrt(ax * ax + ay * ay + az * az)
+            ax *= inv
+            ay *= inv
+            az *= inv
+            # b = a x w
+            bx = ay * wz - az * wy
+            by = az * wx - ax * wz
+            bz = ax * wy - ay * wx
+            inv = 1.0 / math.sqrt(bx * bx + by * by + bz * bz)
+            bx *= inv
+            by *= inv
+            bz *= inv
+            coords3d[i, 0] = O[0] - wx * x + bx * y + ax * z
+            coords3d[i, 1] = O[1] - wy * x + by * y + ay * z
+            coords3d[i, 2] = O[2] - wz * x + bz * y + az * z
+
+
+def _build_coords_batch_lockstep(rind, aind, dind, r, a_rad, d_rad, coords3d):
+    """Place the atoms of a batch of z-matrices with shared topology.
+
+    All z-matrices are processed in lockstep, so every intermediate carries the
+    batch as leading dimension. r, a_rad and d_rad have shape (batch, atoms),
+    coords3d has shape (batch, atoms, 3). Angles are expected in radians."""
+    for i in range(r.shape[1]):
+        if i == 0:
+            continue
+        elif i == 1:
+            coords3d[:, i, 0] = r[:, i]
+        elif i == 2:
+            theta = a_rad[:, i]
+            O = coords3d[:, rind[i]]
+            u = coords3d[:, aind[i]] - O
+            sign = np.copysign(1.0, u[:, 0])
+            x = r[:, i] * np.cos(theta)
+            y = r[:, i] * np.sin(theta)
+            coords3d[:, i, 0] = O[:, 0] + sign * x
+            coords3d[:, i, 1] = O[:, 1] + sign * y
+            coords3d[:, i, 2] = O[:, 2]
+        else:
+            theta = a_rad[:, i]
+            phi = d_rad[:, i]
+            sin_theta = np.sin(theta)
+            x = r[:, i] * np.cos(theta)
+            y = r[:, i] * sin_theta * np.cos(phi)
+            z = r[:, i] * sin_theta * np.sin(phi)
+
+            O = coords3d[:, rind[i]]
+            P = coords3d[:, aind[i]]
+            N = coords3d[:, dind[i]]
+
+            v = P - N
+            v /= np.linalg.norm(v, axis=1)[:, None]
+            w = O - P
+            w /= np.linalg.norm(w, axis=1)[:, None]
+            a = np.cross(v, w)
+            a /= np.linalg.norm(a, axis=1)[:, None]
+            b = np.cross(a, w)
+            b /= np.linalg.norm(b, axis=1)[:, None]
+            basis = np.stack((-w, b, a), axis=1)
+            xyz = np.stack((x, y, z), axis=1)
+            coords3d[:, i] = O + np.einsum("bj,bjk->bk", xyz, basis)
+
+
+@functools.lru_cache(maxsize=None)
+def _jit_kernels():
+    """Kernels compiled with numba, or None when numba is not available.
+
+    numba is only imported and the kernels are only compiled on first use, so
+    importing this module and single builds stay cheap. The kernels are used
+    for batched and repeated builds, where the compilation pays off."""
+    try:
+        import numba
+    except ModuleNotFoundError:
+        return None
+
+    build_coords = numba.njit(cache=True)(_build_coords)
+
+    @numba.njit(parallel=True)
+    def build_coords_batch(rind, aind, dind, r, a_rad, d_rad, coords3d):
+        # Every member of the batch is built by its own thread. The writes to
+        # coords3d[b] are disjoint, so no synchronization is needed.
+        for b in numba.prange(coords3d.shape[0]):
+            build_coords(rind, aind, dind, r[b], a_rad[b], d_rad[b], coords3d[b], 0)
+
+    return build_coords, build_coords_batch
+
+
+INVALID_INDEX_MSG = "Found invalid atom index. Atom indices start with 1, not 0!"
+
+
+@dataclass
+class ZMat:
+    """Z-matrix stored as struct of arrays.
+
+    Atom indices are 0-based and -1 for unset parents. Unset values are NaN.
+    Distances are given in Bohr, angles in degrees."""
+
+    atoms: list
+    rind: np.ndarray
+    aind: np.ndarray
+    dind: np.ndarray
+    r: np.ndarray
+    a: np.ndarray
+    d: np.ndarray
+
+    def __len__(self):
+        return len(self.atoms)
+
+    @staticmethod
+    def from_zlines(zlines):
+        # Transpose the ZLines into columns in one go. Converting to float
+        # maps None onto NaN, so unset entries need no special treatment.
+        atoms, rind, r, aind, a, dind, d = zip(*zlines)
+        inds = np.array((rind, aind, dind), dtype=float)
+        unset = np.isnan(inds)
+        assert (inds[~unset] >= 0).all(), INVALID_INDEX_MSG
+        inds[unset] = -1
+        inds = inds.astype(int)
+        vals = np.array((r, a, d), dtype=float)
+
+        return ZMat(
+            atoms=list(atoms),
+            rind=inds[0],
+            aind=inds[1],
+            dind=inds[2],
+            r=vals[0],
+            a=vals[1],
+            d=vals[2],
+        )
+
+    @staticmethod
+    def from_str(text):
+        # Lines are padded to the full 7 columns: missing atom indices are given
+        # as 0 (unset in 1-based input), missing values as nan.
+        pad = ("", "0", "nan", "0", "nan", "0", "nan")
+        items = list()
+        lengths = list()
+        for line in text.strip().split("\n"):
+            line = line.strip()
+            if (not line) or line.startswith("#"):
+                continue
+            tokens = line.split()[:7]
+            # Every atom index must be followed by its value
+            assert len(tokens) % 2 == 1, f"Malformed z-matrix line: '{line}'!"
+            lengths.append(len(tokens))
+            items.append(tokens + list(pad[len(tokens) :]))
+        table = np.array(items, dtype=str).reshape(-1, 7)
+
+        # Convert whole columns at once
+        inds = table[:, 1::2].astype(int)
+        present = np.array(lengths)[:, None] > np.array((1, 3, 5))
+        assert (inds[present] > 0).all(), INVALID_INDEX_MSG
+        inds -= 1
+        vals = table[:, 2::2].astype(float)
+        vals[:, 0] *= ANG2BOHR
+
+        return ZMat(
+            atoms=table[:, 0].tolist(),
+            rind=inds[:, 0].copy(),
+            aind=inds[:, 1].copy(),
+            dind=inds[:, 2].copy(),
+            r=vals[:, 0].copy(),
+            a=vals[:, 1].copy(),
+            d=vals[:, 2].copy(),
+        )
+
+    @staticmethod
+    def from_fn(fn):
+        with open(fn) as handle:
+            text = handle.read()
+        return ZMat.from_str(text)
+
+    def to_zlines(self):
+        zlines = list()
+        for atom, *items in zip(
+            self.atoms,
+            self.rind.tolist(),
+            self.r.tolist(),
+            self.aind.tolist(),
+            self.a.tolist(),
+            self.dind.tolist(),
+            self.d.tolist(),
+        ):
+            # Indices and values are set pairwise, unset ones stay None
+            nset = sum([ind >= 0 for ind in items[::2]])
+            zlines.append(ZLine(atom, *items[: 2 * nset]))
+        return zlines
+
+
+def _as_zmat(zmat):
+    if isinstance(zmat, str):
+        zmat = ZMat.from_str(zmat)
+    elif not isinstance(zmat, ZMat):
+        zmat = ZMat.from_zlines(zmat)
+    return zmat
+
+
+def coords3d_from_zmat(zmat, coords3d=None, start_at=None):
+    """Cartesian coordinates from a z-matrix, without creating a Geometry.
+
+    Parameters
+    ----------
+    zmat
+        ZMat, list of ZLines or z-matrix string.
+    coords3d
+        Optional array of shape (start_at + len(zmat), 3). The first start_at
+        rows hold already present atoms, the remaining rows are overwritten
+        in-place.
+    start_at
+        Index of the first atom defined by the z-matrix. Defaults to 0.
+
+    Returns
+    -------
+    coords3d
+        Array of shape (start_at + len(zmat), 3). Dummy atoms are kept.
+    """
+    zmat = _as_zmat(zmat)
+    if start_at is None:
+        start_at = 0
+    if coords3d is None:
+        coords3d = np.zeros((start_at + len(zmat), 3), dtype=float)
+    assert len(coords3d) == start_at + len(zmat)
+
+    # Convert all angles at once, outside of the loop
+    a_rad = zmat.a * (math.pi / 180.0)
+    d_rad = zmat.d * (math.pi / 180.0)
+    _build_coords(
+        zmat.rind, zmat.aind, zmat.dind, zmat.r, a_rad, d_rad, coords3d, start_at
+    )
+    return coords3d
+
+
 def geom_from_zmat(
     zmat,
     atoms=None,
@@ -22,10 +342,9 @@ def geom_from_zmat(
 ):
     """Adapted from https://github.com/robashaw/geomConvert by Robert Shaw."""
 
-    if isinstance(zmat, str):
-        zmat = zmat_from_str(zmat)
+    zmat = _as_zmat(zmat)
 
-    zmat_atoms = [zline.atom for zline in zmat]
+    zmat_atoms = zmat.atoms
     # Extend supplied geometry by zmat
     if geom is not None:
         atoms = geom.atoms
@@ -51,77 +370,7 @@ def geom_from_zmat(
     if start_at is None:
         start_at = 0
 
-    for i, zline in enumerate(zmat, start_at):
-        assert all(
-            [
-                (ind is None) or (ind >= 0)
-                for ind in (zline.rind, zline.aind, zline.dind)
-            ]
-        ), "Found invalid atom index. Atom indices start with 1, not 0!"
-
-        r = zline.r
-        # First atom is placed at the origin
-        if i == 0:
-            continue
-        # Bond along x-axis
-        elif i == 1:
-            coords3d[i, 0] = r
-        # Angle in xy-plane from polar coordinates
-        elif i == 2:
-            r"""
-            M       P <- add
-             \     /
-              u   v
-               \ /
-                O
-            """
-            theta = np.deg2rad(zline.a)
-            # Center
-            O = coords3d[zline.rind]
-            # Bond, pointing away from O to M
-            u = coords3d[zline.aind] - O
-            # Direction of u along x axis (left/right)
-            sign = np.sign(u[0])
-            # Polar coordinates
-            x = r * np.cos(theta)
-            y = r * np.sin(theta)
-            # Translate from center with correct orientation
-            coords3d[i] = O + (sign * x, sign * y, 0.0)
-        # Dihedral in xyz-space from spherical coordinates
-        else:
-            theta, phi = np.deg2rad((zline.a, zline.d))
-
-            sin_theta = np.sin(theta)
-            cos_theta = np.cos(theta)
-            sin_phi = np.sin(phi)
-            cos_phi = np.cos(phi)
-
-            x = r * cos_theta
-            y = r * sin_theta * cos_phi
-            z = r * sin_theta * sin_phi
-
-            r"""
-            M <- add      N
-             \           /
-              u         v
-               \       /
-                O--w--P
-            """
-
-            O = coords3d[zline.rind]
-            P = coords3d[zline.aind]
-            N = coords3d[zline.dind]
-
-            # Local axis system
-            v_ = P - N
-            v = v_ / np.linalg.norm(v_)
-            w_ = O - P
-            w = w_ / np.linalg.norm(w_)
-            a = np.cross(v, w)
-            a /= np.linalg.norm(a)
-            b = np.cross(a, w)
-            b /= np.linalg.norm(b)
-            coords3d[i] = O - w * x + b * y + a * z
+    coords3d = coords3d_from_zmat(zmat, coords3d=coords3d, start_at=start_at)
 
     if drop_dummy:
         atoms_ = list()
@@ -138,29 +387,252 @@ def geom_from_zmat(
     return geom
 
 
+class ZMatCache:
+    """Keeps the Cartesian coordinates of a z-matrix for incremental updates.
+
+    As atoms only depend on atoms defined before them, changing a value of
+    atom i only requires rebuilding atoms i, i+1, ... . The coordinates of
+    the preceding atoms are reused from the last build.
+
+    Parameters
+    ----------
+    zmat
+        ZMat, list of ZLines or z-matrix string. Its arrays are copied.
+    """
+
+    def __init__(self, zmat):
+        zmat = _as_zmat(zmat)
+        self.zmat = ZMat(
+            atoms=list(zmat.atoms),
+            rind=zmat.rind.copy(),
+            aind=zmat.aind.copy(),
+            dind=zmat.dind.copy(),
+            r=zmat.r.copy(),
+            a=zmat.a.copy(),
+            d=zmat.d.copy(),
+        )
+        self.a_rad = self.zmat.a * (math.pi / 180.0)
+        self.d_rad = self.zmat.d * (math.pi / 180.0)
+        self._coords3d = np.zeros((len(self.zmat), 3), dtype=float)
+        # The cache is meant for repeated updates, so the compiled kernel is
+        # used when available.
+        kernels = _jit_kernels()
+        self._build_coords = _build_coords if kernels is None else kernels[0]
+        self.last_changed_i = 0
+        self._rebuild(0)
+
+    @property
+    def coords3d(self):
+        """Current coordinates. The array is updated in-place, copy it
+        if it has to be kept."""
+        return self._coords3d
+
+    def _rebuild(self, start_at):
+        zmat = self.zmat
+        self._build_coords(
+            zmat.rind[start_at:],
+            zmat.aind[start_at:],
+            zmat.dind[start_at:],
+            zmat.r[start_at:],
+            self.a_rad[start_at:],
+            self.d_rad[start_at:],
+            self._coords3d,
+            start_at,
+        )
+        self.last_changed_i = start_at
+
+    def update(self, changes):
+        """Update z-matrix values and rebuild the affected atoms.
+
+        Parameters
+        ----------
+        changes
+            Dict, mapping atom indices to dicts with the new values, e.g.
+            {3: {"d": 120.0}}. Valid keys are "r" (Bohr), "a" and "d"
+            (degrees).
+
+        Returns
+        -------
+        coords3d
+            Updated coordinates of shape (atoms, 3).
+        """
+        if not changes:
+            return self._coords3d
+        for ind, values in changes.items():
+            for key, value in values.items():
+                assert key in ("r", "a", "d"), f"Invalid key '{key}'!"
+                getattr(self.zmat, key)[ind] = value
+                if key == "a":
+                    self.a_rad[ind] = value * (math.pi / 180.0)
+                elif key == "d":
+                    self.d_rad[ind] = value * (math.pi / 180.0)
+        self._rebuild(min(changes.keys()))
+        return self._coords3d
+
+
+def coords3d_from_zmat_batch(zmat, r, a, d, dtype=np.float32):
+    """Cartesian coordinates for a batch of z-matrices with shared topology.
+
+    Parameters
+    ----------
+    zmat
+        ZMat, list of ZLines or z-matrix string, defining the atoms and the
+        connectivity shared by all members of the batch. Its values are ignored.
+    r, a, d
+        Arrays of shape (batch, atoms), holding distances in Bohr and angles
+        and dihedrals in degrees. Unused entries are ignored.
+    dtype
+        Floating point type used for the build and the returned coordinates.
+        Single precision is sufficient for starting guesses or visualization;
+        pass np.float64 for full precision.
+
+    Returns
+    -------
+    coords3d
+        Array of shape (batch, atoms, 3) and the given dtype. Dummy atoms are
+        kept.
+    """
+    zmat = _as_zmat(zmat)
+
+    r, a, d = [np.atleast_2d(np.asarray(arr, dtype=dtype)) for arr in (r, a, d)]
+    assert r.shape == a.shape == d.shape
+    batch_size, num = r.shape
+    assert num == len(zmat)
+
+    coords3d = np.zeros((batch_size, num, 3), dtype=dtype)
+    a_rad = a * (math.pi / 180.0)
+    d_rad = d * (math.pi / 180.0)
+    kernels = _jit_kernels()
+    # Without numba the lockstep variant is used, as it keeps the loops over
+    # the batch inside numpy.
+    if kernels is None:
+        build_coords_batch = _build_coords_batch_lockstep
+    else:
+        _, build_coords_batch = kernels
+    build_coords_batch(zmat.rind, zmat.aind, zmat.dind, r, a_rad, d_rad, coords3d)
+    return coords3d
+
+
+_BOND_TPL = """
+    # Atom {i}
+    coords3d[{i}, 0] = r[{i}]"""
+
+_ANGLE_TPL = """
+    # Atom {i}
+    theta = a_rad[{i}]
+    sign = math.copysign(1.0, coords3d[{ai}, 0] - coords3d[{ri}, 0])
+    x = r[{i}] * math.cos(theta)
+    y = r[{i}] * math.sin(theta)
+    coords3d[{i}, 0] = coords3d[{ri}, 0] + sign * x
+    coords3d[{i}, 1] = coords3d[{ri}, 1] + sign * y
+    coords3d[{i}, 2] = coords3d[{ri}, 2]"""
+
+_DIHEDRAL_TPL = """
+    # Atom {i}
+    sin_theta = math.sin(a_rad[{i}])
+    cos_theta = math.cos(a_rad[{i}])
+    sin_phi = math.sin(d_rad[{i}])
+    cos_phi = math.cos(d_rad[{i}])
+    x = r[{i}] * cos_theta
+    y = r[{i}] * sin_theta * cos_phi
+    z = r[{i}] * sin_theta * sin_phi
+    vx = coords3d[{ai}, 0] - coords3d[{di}, 0]
+    vy = coords3d[{ai}, 1] - coords3d[{di}, 1]
+    vz = coords3d[{ai}, 2] - coords3d[{di}, 2]
+    inv = 1.0 / math.sqrt(vx * vx + vy * vy + vz * vz)
+    vx *= inv
+    vy *= inv
+    vz *= inv
+    wx = coords3d[{ri}, 0] - coords3d[{ai}, 0]
+    wy = coords3d[{ri}, 1] - coords3d[{ai}, 1]
+    wz = coords3d[{ri}, 2] - coords3d[{ai}, 2]
+    inv = 1.0 / math.sqrt(wx * wx + wy * wy + wz * wz)
+    wx *= inv
+    wy *= inv
+    wz *= inv
+    ax = vy * wz - vz * wy
+    ay = vz * wx - vx * wz
+    az = vx * wy - vy * wx
+    inv = 1.0 / math.sqrt(ax * ax + ay * ay + az * az)
+    ax *= inv
+    ay *= inv
+    az *= inv
+    bx = ay * wz - az * wy
+    by = az * wx - ax * wz
+    bz = ax * wy - ay * wx
+    inv = 1.0 / math.sqrt(bx * bx + by * by + bz * bz)
+    bx *= inv
+    by *= inv
+    bz *= inv
+    coords3d[{i}, 0] = coords3d[{ri}, 0] - wx * x + bx * y + ax * z
+    coords3d[{i}, 1] = coords3d[{ri}, 1] - wy * x + by * y + ay * z
+    coords3d[{i}, 2] = coords3d[{ri}, 2] - wz * x + bz * y + az * z"""
+
+
+@functools.lru_cache(maxsize=None)
+def _specialized_kernel(topology):
+    lines = ["def kernel(r, a_rad, d_rad, coords3d):"]
+    for i, (ri, ai, di) in enumerate(topology):
+        if i == 0:
+            continue
+        elif i == 1:
+            tpl = _BOND_TPL
+        elif i == 2:
+            tpl = _ANGLE_TPL
+        else:
+            tpl = _DIHEDRAL_TPL
+        lines.append(tpl.format(i=i, ri=ri, ai=ai, di=di))
+    lines.append("    return coords3d\n")
+    src = "\n".join(lines)
+
+    namespace = {"math": math}
+    exec(compile(src, f"<zmat kernel {len(topology)} atoms>", "exec"), namespace)
+    kernel = namespace["kernel"]
+    try:
+        import numba
+
+        kernel = numba.njit(kernel)
+    except ModuleNotFoundError:
+        pass
+    return kernel
+
+
+def build_specialized(zmat):
+    """Kernel specialized to the topology of a z-matrix.
+
+    The source of the kernel is generated with all loops unrolled and the
+    parent indices inserted as literals; it is compiled with numba, when
+    available. Kernels are cached by topology, so z-matrices that only
+    differ in their values share one kernel.
+
+    Parameters
+    ----------
+    zmat
+        ZMat, list of ZLines or z-matrix string.
+
+    Returns
+    -------
+    kernel
+        Function kernel(r, a_rad, d_rad, coords3d) that fills the array
+        coords3d of shape (atoms, 3) in-place and returns it. Distances are
+        expected in Bohr, angles in radians.
+    """
+    zmat = _as_zmat(zmat)
+    topology = tuple(
+        zip(zmat.rind.tolist(), zmat.aind.tolist(), zmat.dind.tolist())
+    )
+    return _specialized_kernel(topology)
+
+
 def geom_from_zmat_str(text, coord_type="cart", coord_kwargs=None):
-    zmat = zmat_from_str(text)
+    zmat = ZMat.from_str(text)
     return geom_from_zmat(zmat, coord_type=coord_type, coord_kwargs=coord_kwargs)
 
 
 def zmat_from_str(text):
-    def dec(str_):
-        return int(str_) - 1
-
-    def to_bohr(str_):
-        return float(str_) * ANG2BOHR
-
-    def convert(items):
-        funcs = (str, dec, to_bohr, dec, float, dec, float)
-        return [f(item) for f, item in zip(funcs, items)]
-
-    zmat = list()
-    for line in text.strip().split("\n"):
-        line = line.strip()
-        if line.startswith("#"):
-            continue
-        zmat.append(ZLine(*convert(line.split())))
-    return zmat
+    """List of ZLines from a z-matrix string. See ZMat.from_str() for a
+    struct-of-arrays z-matrix."""
+    return ZMat.from_str(text).to_zlines()
 
 
 def zmat_from_fn(fn):
@@ -170,6 +642,6 @@ def zmat_from_fn(fn):
 
 
 def geom_from_zmat_fn(fn, **geom_kwargs):
-    zmat = zmat_from_fn(fn)
+    zmat = ZMat.from_fn(fn)
     geom = geom_from_zmat(zmat, **geom_kwargs)
     return geom
@@ -1,23 +1,15 @@
 import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import functools
+import os
 from pathlib import Path
 import sys
 import textwrap
 
-import h5py
-import matplotlib
-from matplotlib.animation import FuncAnimation
-from matplotlib.patches import Rectangle
-import matplotlib.image as mpimg
-import matplotlib.pyplot as plt
 import numpy as np
-from scipy.interpolate import splrep, splev
 
 from pysisyphus.constants import AU2KJPERMOL, AU2KCALPERMOL, AU2EV
 from pysisyphus.config import OUT_DIR_DEFAULT
-from pysisyphus.dynamics import Gaussian
-from pysisyphus.io import parse_xyz
-from pysisyphus.peakdetect import peakdetect
-from pysisyphus.wrapper.jmol import render_cdd_cube
 
 
 CDD_PNG_FNS = "cdd_png_fns"
@@ -33,6 +25,36 @@ def get_en_conv():
     return AU2KJPERMOL, "kJ mol⁻¹"
 
 
+@functools.lru_cache(maxsize=None)
+def _numexpr():
+    """Optional numexpr module, imported on first use. None if unavailable."""
+    try:
+        import numexpr
+    except ModuleNotFoundError:
+        numexpr = None
+    return numexpr
+
+
+def shift_and_scale(arr, scale, shift=None):
+    """Calculate (arr - shift) * scale in place.
+
+    shift defaults to the minimum of arr. When numexpr is available both
+    operations are done in one pass over the array."""
+    if shift is None:
+        shift = arr.min()
+    numexpr = _numexpr()
+    if numexpr is not None and arr.dtype == np.float64 and arr.flags.c_contiguous:
+        numexpr.evaluate(
+            "(arr - shift) * scale",
+            local_dict={"arr": arr, "shift": shift, "scale": scale},
+            out=arr,
+        )
+    else:
+        arr -= shift
+        arr *= scale
+    return arr
+
+
 def get_force_unit(coord_type):
     force_unit = "$E_h$ Bohr⁻¹"
     if coord_type != "cart":
@@ -40,14 +62,76 @@ def get_force_unit(coord_type):
     return force_unit
 
 
+def _open_h5(h5_fn):
+    """Open HDF5 file read-only with a bigger chunk cache.
+
+    The default raw data chunk cache of 1 MiB is easily exceeded by the chunks
+    of bigger datasets, leading to repeated reads of the same chunks."""
+    import h5py
+
+    return h5py.File(
+        h5_fn, "r", rdcc_nbytes=64 * 1024 ** 2, rdcc_nslots=10007, rdcc_w0=0.75
+    )
+
+
+def read_direct(dataset, num=None):
+    """Read the first 'num' entries of a HDF5 dataset into a fresh array.
+
+    Reading into a preallocated array via Dataset.read_direct() avoids the
+    intermediate array that slicing creates inside h5py. If num is None the
+    whole dataset is read."""
+    if num is None:
+        num = dataset.shape[0] if dataset.shape else None
+    if num is None:
+        return dataset[()]
+    num = min(num, dataset.shape[0])
+    arr = np.empty((num,) + dataset.shape[1:], dtype=dataset.dtype)
+    if num > 0:
+        dataset.read_direct(arr, source_sel=np.s_[:num], dest_sel=np.s_[:num])
+    return arr
+
+
+def iter_row_blocks(dataset, block_size=1024):
+    """Iterate over blocks of rows of a HDF5 dataset.
+
+    For chunked datasets the blocks are aligned with the chunk boundaries
+    along the first axis, so every chunk is only read once. Yields tuples
+    of (row slice, block)."""
+    rows = dataset.shape[0]
+    if dataset.chunks is not None:
+        block_size = dataset.chunks[0]
+    for start in range(0, rows, block_size):
+        sl = slice(start, min(start + block_size, rows))
+        yield sl, dataset[sl]
+
+
+def plot_rows(ax, rows, colors):
+    """Plot every row of a 2d array as line with markers.
+
+    All rows are drawn by one LineCollection and one scatter plot, instead of
+    creating one Line2D per row."""
+    from matplotlib.collections import LineCollection
+
+    xs = np.arange(rows.shape[1])
+    segments = np.stack(np.broadcast_arrays(xs[None, :], rows), axis=-1)
+    ax.add_collection(LineCollection(segments, colors=colors))
+    point_colors = np.repeat(colors, xs.size, axis=0)
+    ax.scatter(np.tile(xs, len(rows)), rows.flatten(), c=point_colors, s=36)
+    ax.autoscale_view()
+
+
 def spline_plot_cycles(cart_coords, energies):
-    num_cycles = energies.shape[1]
+    import matplotlib
+    import matplotlib.pyplot as plt
+    from scipy.interpolate import splrep, splev
+
+    from pysisyphus.peakdetect import peakdetect
+
+    num_cycles = energies.shape[0]
 
     fig, ax = plt.subplots()
     colors = matplotlib.cm.Greys(np.linspace(0.2, 1, num=num_cycles))
-    # for cycle, color in zip(energies, colors):
-    for i, (cycle, color) in enumerate(zip(energies, colors)):
-        ax.plot(cycle, "o-", color=color)
+    plot_rows(ax, energies, colors)
     ax.set_title("COS image energies")
 
     kwargs = {
@@ -88,6 +172,8 @@ def spline_plot_cycles(cart_coords, energies):
 
 
 def plot_cycle(cart_coords, energies):
+    import matplotlib.pyplot as plt
+
     # Plot last_cycle
     fig, ax = plt.subplots()
     last_energies = energies[-1].copy()
@@ -122,26 +208,38 @@ def plot_cycle(cart_coords, energies):
 
 
 def anim_cos(cart_coords, energies):
-    num_cycles = cart_coords.shape[0]
+    from matplotlib.animation import FuncAnimation
+    import matplotlib.pyplot as plt
+
+    num_cycles = len(cart_coords)
 
     # Also do an animation
     min_ = np.nanmin(energies)
     max_ = np.nanmax(energies)
 
-    coord_diffs = np.linalg.norm(cart_coords - cart_coords[0][0], axis=2)
+    ref_coords = cart_coords[0][0]
+
+    # The differences are calculated when a frame is drawn, so with lazily
+    # loaded coordinates every cycle is only read when it is shown.
+    def coord_diffs(cycle):
+        return np.linalg.norm(cart_coords[cycle] - ref_coords, axis=1)
+
     fig, ax = plt.subplots()
 
     # Initial energies
-    lines = ax.plot(coord_diffs[0], energies[0], "o-")
+    (line,) = ax.plot(coord_diffs(0), energies[0], "o-")
     y_max = max_ - min_
     ax.set_ylim(0, y_max)
     ax.set_xlabel("Coordinate differences / Bohr")
     ax.set_ylabel(DE_LABEL)
+    # With blitting only the artists inside the axes are redrawn, so the cycle
+    # is shown in the axes instead of in the figure title.
+    cycle_text = ax.text(0.98, 0.95, "", transform=ax.transAxes, ha="right")
 
     def update_func(i):
-        fig.suptitle("Cycle {}".format(i))
-        lines[0].set_xdata(coord_diffs[i])
-        lines[0].set_ydata(energies[i])
+        line.set_data(coord_diffs(i), energies[i])
+        cycle_text.set_text(f"Cycle {i}")
+        return line, cycle_text
 
     def animate():
         animation = FuncAnimation(
@@ -149,6 +247,7 @@ def anim_cos(cart_coords, energies):
             update_func,
             frames=num_cycles,
             interval=250,
+            blit=True,
         )
         return animation
 
@@ -156,79 +255,148 @@ def anim_cos(cart_coords, energies):
     return anim, fig, ax
 
 
-def load_h5(h5_fn, h5_group, datasets=None, attrs=None):
+class LazyByImage:
+    """Per-cycle access to a COS dataset that is only read when indexed.
+
+    Indexing with a cycle returns an array of shape (images, coords), sorted
+    by image, with NaN for images that are not present in this cycle."""
+
+    def __init__(self, dataset, num_cycles, coord_size, image_inds, image_nums):
+        self.dataset = dataset
+        self.shape = (num_cycles, dataset.shape[1] // coord_size, coord_size)
+        self.image_inds = image_inds
+        self.image_nums = image_nums
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __getitem__(self, cycle):
+        num_cycles = self.shape[0]
+        if cycle < 0:
+            cycle += num_cycles
+        if not (0 <= cycle < num_cycles):
+            raise IndexError(f"Cycle {cycle} is out of range!")
+        arr = self.dataset[cycle].reshape(self.shape[1:])
+        by_image = np.full_like(arr, np.nan)
+        img_num = self.image_nums[cycle]
+        by_image[self.image_inds[cycle, :img_num]] = arr[:img_num]
+        return by_image
+
+
+def load_h5(h5_fn, h5_group, datasets=None, attrs=None, lazy=False):
+    """Load datasets and attributes of a COS optimization from HDF5.
+
+    With lazy=True, 'cart_coords' and 'forces' are not read, but returned as
+    LazyByImage objects, that read single cycles on demand. In this case the
+    HDF5 file is kept open and its handle is returned alongside the datasets.
+    It has to be closed by the caller."""
     if datasets is None:
         datasets = list()
 
     if attrs is None:
         attrs = list()
 
-    with h5py.File(h5_fn, "r") as handle:
+    lazy_datasets = ("cart_coords", "forces") if lazy else ()
+
+    handle = _open_h5(h5_fn)
+    try:
         group = handle[h5_group]
+        # Read all attributes at once
+        group_attrs = dict(group.attrs.items())
 
-        atoms = group.attrs["atoms"]
-        cur_cycle = group.attrs["cur_cycle"]
-        coord_size = group.attrs["coord_size"]
+        atoms = group_attrs["atoms"]
+        cur_cycle = group_attrs["cur_cycle"]
+        coord_size = group_attrs["coord_size"]
         num_cycles = cur_cycle + 1
 
         image_nums = group["image_nums"][:num_cycles].astype(int)
         image_inds = group["image_inds"][:num_cycles].astype(int)
 
+        # We can't use coord_size for the Cartesian coordinates because
+        # coord_type may be != cart and then coord_size gives the number of
+        # internals. For the forces we can use coord_size because forces will
+        # always be in the same coordinate system as the actual coordinates.
+        coord_sizes = {
+            "cart_coords": 3 * len(atoms),
+            "forces": coord_size,
+        }
+
         _datasets = dict()
         for ds in datasets:
             try:
-                _datasets[ds] = group[ds][:num_cycles]
+                if ds in lazy_datasets:
+                    _datasets[ds] = LazyByImage(
+                        group[ds],
+                        num_cycles,
+                        coord_sizes[ds],
+                        image_inds,
+                        image_nums,
+                    )
+                else:
+                    _datasets[ds] = read_direct(group[ds], num_cycles)
             except KeyError:
                 print(f"Could not load dataset '{ds}' from HDF5 file.")
 
         _attrs = dict()
         for a in attrs:
             try:
-                _attrs[a] = group.attrs[a]
+                _attrs[a] = group_attrs[a]
             except KeyError:
                 print(f"Could not load attribute '{a}' from HDF5 file.")
 
-    en_conv, _ = get_en_conv()
-    if "energies" in _datasets:
-        ens = _datasets["energies"]
-        ens -= ens.min()
-        ens *= en_conv
+        # The file is only kept open for lazily loaded datasets
+        if not lazy:
+            handle.close()
 
-    try:
-        # We can't use coord_size because coord_type may be != cart and then
-        # coord_size gives the number of internals.
-        cart_shape = (num_cycles, -1, 3 * len(atoms))
-        _datasets["cart_coords"] = _datasets["cart_coords"].reshape(cart_shape)
-    except KeyError:
-        pass
+        en_conv, _ = get_en_conv()
+        if "energies" in _datasets:
+            ens = _datasets["energies"]
+            shift_and_scale(ens, en_conv)
 
-    try:
-        # Here we can use coord_size because forces will always be in the same
-        # coordinate system as the actual coordinates.
-        _datasets["forces"] = _datasets["forces"].reshape((num_cycles, -1, coord_size))
-    except KeyError:
-        pass
-
-    def sort_by_image(arr):
-        by_image = np.full_like(arr, np.nan)
-        for cyc, (img_ind, img_num) in enumerate(zip(image_inds, image_nums)):
-            img_ind = img_ind[:img_num]
-            by_image[cyc, img_ind] = arr[cyc, :img_num]
-        return by_image
-
-    for k, v in _datasets.items():
-        _datasets[k] = sort_by_image(v)
-
-    # Also copy requested attributes into dictionary
-    _datasets.update(_attrs)
+        for ds, size in coord_sizes.items():
+            if (ds in _datasets) and (ds not in lazy_datasets):
+                _datasets[ds] = _datasets[ds].reshape((num_cycles, -1, size))
 
+        # Flat (cycle, slot) indices of all valid entries. In every cycle only the
+        # first 'img_num' slots are populated.
+        cyc_idx, slot_idx = np.nonzero(
+            np.arange(image_inds.shape[1])[None, :] < image_nums[:, None]
+        )
+        img_idx = image_inds[cyc_idx, slot_idx]
+
+        def sort_by_image(arr):
+            by_image = np.full_like(arr, np.nan)
+            by_image[cyc_idx, img_idx] = arr[cyc_idx, slot_idx]
+            return by_image
+
+        for k, v in _datasets.items():
+            if k not in lazy_datasets:
+                _datasets[k] = sort_by_image(v)
+
+        # Also copy requested attributes into dictionary
+        _datasets.update(_attrs)
+    except BaseException:
+        # Don't leak the handle, and with it the file lock, on errors.
+        handle.close()
+        raise
+
+    if lazy:
+        return _datasets, handle
     return _datasets
 
 
-def plot_cos_energies(h5_fn="optimization.h5", h5_group="opt"):
+def plot_cos_energies(h5_fn="optimization.h5", h5_group="opt", lazy=False):
+    import matplotlib.pyplot as plt
+
     results = load_h5(
-        h5_fn, h5_group, datasets=("cart_coords", "energies"), attrs=("is_cos",)
+        h5_fn,
+        h5_group,
+        datasets=("cart_coords", "energies"),
+        attrs=("is_cos",),
+        lazy=lazy,
     )
+    if lazy:
+        results, handle = results
     cart_coords = results["cart_coords"]
     energies = results["energies"]
 
@@ -248,9 +416,14 @@ def plot_cos_energies(h5_fn="optimization.h5", h5_group="opt"):
     )  # lgtm [py/unused-local-variable]
 
     plt.show()
+    if lazy:
+        handle.close()
 
 
 def plot_cos_forces(h5_fn="optimization.h5", h5_group="opt", last=15):
+    import matplotlib
+    import matplotlib.pyplot as plt
+
     results = load_h5(
         h5_fn,
         h5_group,
@@ -266,8 +439,9 @@ def plot_cos_forces(h5_fn="optimization.h5", h5_group="opt", last=15):
     assert results["is_cos"]
 
     last_axis = forces.ndim - 1
-    max_ = np.nanmax(np.abs(forces), axis=last_axis)
-    rms = np.sqrt(np.mean(forces ** 2, axis=last_axis))
+    # Missing images are NaN as a whole, so there is no need for nanmax.
+    max_ = np.abs(forces).max(axis=last_axis)
+    rms = np.sqrt(np.einsum("...i,...i->...", forces, forces) / forces.shape[-1])
     hei_indices = energies.argmax(axis=1)
     force_unit = get_force_unit(coord_type)
 
@@ -286,9 +460,9 @@ def plot_cos_forces(h5_fn="optimization.h5", h5_group="opt", last=15):
         alphas = np.linspace(0.125, 1, num=num)
         colors = matplotlib.cm.Greys(np.linspace(0, 1, num=num))
         colors[-1] = (1., 0., 0., 1.)  # use red for latest cycle
-        for row, color, alpha in zip(data, colors, alphas):
-            ax.plot(row, "o-", color=color, alpha=alpha)
-            ax.set_ylabel(force_unit)
+        colors[:, 3] = alphas
+        plot_rows(ax, data, colors)
+        ax.set_ylabel(force_unit)
         ax.set_yscale("log")
         if title:
             ax.set_title(title)
@@ -309,42 +483,36 @@ def plot_cos_forces(h5_fn="optimization.h5", h5_group="opt", last=15):
 
 
 def plot_all_energies(h5):
-    with h5py.File(h5) as handle:
-        energies = handle["all_energies"][:]
-        roots = handle["roots"][:]
-        flips = handle["root_flips"][:]
+    import matplotlib.pyplot as plt
+
+    with _open_h5(h5) as handle:
+        roots = read_direct(handle["roots"])
+        flips = read_direct(handle["root_flips"])
         ovlp_type = handle.attrs["ovlp_type"]
         ovlp_with = handle.attrs["ovlp_with"]
+        # Don't plot steps where flips occured. Only the energies of the
+        # remaining steps are read from the file.
+        flips = flips.astype(bool)
+        steps = np.flatnonzero(~flips)
+        all_energies = handle["all_energies"]
+        if steps.size:
+            energies = all_energies[steps]
+        else:
+            energies = np.empty((0,) + all_energies.shape[1:])
     print(f"Overlap type: '{ovlp_type}', overlaps with: '{ovlp_with}'.")
     print(f"Found a total of {len(roots)} steps.")
     print(f"{flips} root flips occured.")
 
-    energies -= energies.min()
-    energies *= AU2EV
-
-    # Don't plot steps where flips occured
-    # energies = np.concatenate((energies[0][None,:], energies[1:,:][~flips]), axis=0)
-    energies_ = list()
-    roots_ = list()
-    steps = list()
-    for i, root_flip in enumerate(flips[:-1]):
-        if root_flip:
-            print(f"Root flip occured between {i} and {i+1}.")
-            continue
-        print(f"Using step {i}")
-        energies_.append(energies[i])
-        roots_.append(roots[i])
-        steps.append(i)
-    # Don't append last step if a root flip occured there.
-    if not flips[-1]:
-        energies_.append(energies[-1])
-        roots_.append(roots[-1])
-        steps.append(i + 1)
-    else:
+    for i in np.flatnonzero(flips[:-1]):
+        print(f"Root flip occured between {i} and {i+1}.")
+    # Don't use last step if a root flip occured there.
+    if flips[-1]:
         print("Root flip occured in the last step. Not showing the last step.")
+    print(f"Using steps {steps.tolist()}")
 
-    energies = np.array(energies_)
-    roots = np.array(roots_)
+    if energies.size:
+        shift_and_scale(energies, AU2EV)
+    roots = roots[steps]
 
     fig, ax = plt.subplots()
     for i, state in enumerate(energies.T):
@@ -360,7 +528,9 @@ def plot_all_energies(h5):
 
 
 def plot_md(h5_group="run"):
-    with h5py.File("md.h5", "r") as handle:
+    import matplotlib.pyplot as plt
+
+    with _open_h5("md.h5") as handle:
         group = handle[h5_group]
 
         steps = group["step"][:]
@@ -406,6 +576,10 @@ def plot_md(h5_group="run"):
 
 
 def plot_gau(gau_fns, num=50):
+    import matplotlib.pyplot as plt
+
+    from pysisyphus.dynamics import Gaussian
+
     print("Assuming constant Gaussian s & w!")
 
     assert (
@@ -465,7 +639,11 @@ def plot_gau(gau_fns, num=50):
 
 
 def plot_overlaps(h5, thresh=0.1):
-    with h5py.File(h5, "r") as handle:
+    import matplotlib.image as mpimg
+    from matplotlib.patches import Rectangle
+    import matplotlib.pyplot as plt
+
+    with _open_h5(h5) as handle:
         overlaps = handle["overlap_matrices"][:]
         roots = handle["roots"][:]
         calculated_roots = handle["calculated_roots"][:]
@@ -489,16 +667,33 @@ def plot_overlaps(h5, thresh=0.1):
                 print(f"Found image data in '{CDD_PNG_FNS}'")
             except FileNotFoundError:
                 cdd_img_fns = None
-    cdd_imgs = None
+    load_cdd_img = None
     if cdd_img_fns is not None:
-        try:
-            cdd_imgs = [mpimg.imread(fn) for fn in cdd_img_fns]
-        except FileNotFoundError:
-            png_paths = [Path(fn.decode()).name for fn in cdd_img_fns]
-            cdd_imgs = [mpimg.imread(fn) for fn in png_paths]
-        print(f"Found rendered {len(cdd_imgs)} CDD images.")
-
-    overlaps[np.abs(overlaps) < thresh] = np.nan
+        cdd_img_fns = [
+            fn.decode() if isinstance(fn, bytes) else fn for fn in cdd_img_fns
+        ]
+
+        # Images are only read when they are displayed. A few of them are kept,
+        # so switching back and forth between cycles stays fast.
+        @functools.lru_cache(maxsize=8)
+        def load_cdd_img(i):
+            fn = cdd_img_fns[i]
+            if not Path(fn).exists():
+                fn = Path(fn).name
+            return mpimg.imread(fn)
+
+        print(f"Found rendered {len(cdd_img_fns)} CDD images.")
+
+    # Hide small overlaps
+    numexpr = _numexpr()
+    if numexpr is not None and overlaps.dtype == np.float64:
+        numexpr.evaluate(
+            "where(abs(overlaps) < thresh, nan, overlaps)",
+            local_dict={"overlaps": overlaps, "thresh": thresh, "nan": np.nan},
+            out=overlaps,
+        )
+    else:
+        overlaps[np.abs(overlaps) < thresh] = np.nan
     print(f"Overlap type: {ovlp_type}")
     print(f"Overlap with: {ovlp_with}")
     print(f"Found {len(overlaps)} overlap matrices.")
@@ -510,32 +705,39 @@ def plot_overlaps(h5, thresh=0.1):
     print("i: switch between current and first cycle.")
     print("e: switch between current and last cycle.")
 
-    fig, ax = plt.subplots()
-
     n_states = overlaps[0].shape[0]
 
+    # All artists are created only once and are updated in draw(), instead of
+    # clearing and recreating the whole figure on every key press.
+    fig = plt.figure()
+    if load_cdd_img is not None:
+        ax = fig.add_subplot(121)
+        ax1 = fig.add_subplot(122)
+    else:
+        ax = fig.add_subplot(111)
+        ax1 = None
+    im = ax.imshow(np.abs(overlaps[0]), vmin=0, vmax=1)
+    ax.grid(color="#CCCCCC", linestyle="--", linewidth=1)
+    ax.set_xticks(np.arange(n_states, dtype=int))
+    ax.set_yticks(np.arange(n_states, dtype=int))
+    # set_ylim is needed, otherwise set_yticks drastically shrinks the plot
+    ax.set_ylim(n_states - 0.5, -0.5)
+    ax.set_xlabel("new roots")
+    ax.set_ylabel("reference roots")
+    text_artists = [
+        [ax.text(k, l, "", ha="center", va="center") for k in range(n_states)]
+        for l in range(n_states)
+    ]
+    highlight = Rectangle((-0.5, -0.5), 1, 1, fill=False, color="red", lw=4)
+    ax.add_artist(highlight)
+    cdd_im = ax1.imshow(load_cdd_img(0)) if ax1 is not None else None
+    suptitle = fig.suptitle("")
+
     def draw(i):
-        fig.clf()
-        if cdd_imgs is not None:
-            ax = fig.add_subplot(121)
-            ax1 = fig.add_subplot(122)
-        else:
-            ax = fig.add_subplot(111)
-            ax1 = None
         o = np.abs(overlaps[i])
-        ax.imshow(o, vmin=0, vmax=1)
-        ax.grid(color="#CCCCCC", linestyle="--", linewidth=1)
-        ax.set_xticks(np.arange(n_states, dtype=np.int))
-        ax.set_yticks(np.arange(n_states, dtype=np.int))
-        # set_ylim is needed, otherwise set_yticks drastically shrinks the plot
-        ax.set_ylim(n_states - 0.5, -0.5)
-        ax.set_xlabel("new roots")
-        ax.set_ylabel("reference roots")
+        im.set_data(o)
         for (l, k), value in np.ndenumerate(o):
-            if np.isnan(value):
-                continue
-            value_str = f"{abs(value):.2f}"
-            ax.text(k, l, value_str, ha="center", va="center")
+            text_artists[l][k].set_text("" if np.isnan(value) else f"{value:.2f}")
         j, k = ref_cycles[i], i + 1
         ref_root = ref_roots[i]
         ref_ind = ref_root - 1
@@ -545,17 +747,15 @@ def plot_overlaps(h5, thresh=0.1):
         new_root = roots[i + 1]
         ref_overlaps = o[ref_ind]
         argmax = np.nanargmax(ref_overlaps)
-        xy = (argmax - 0.5, ref_ind - 0.5)
-        highlight = Rectangle(xy, 1, 1, fill=False, color="red", lw="4")
-        ax.add_artist(highlight)
-        if ax1:
-            ax1.imshow(cdd_imgs[i])
-        fig.suptitle(
+        highlight.set_xy((argmax - 0.5, ref_ind - 0.5))
+        if cdd_im is not None:
+            cdd_im.set_data(load_cdd_img(i))
+        suptitle.set_text(
             f"overlap {i:03d}\n"
             f"{ovlp_type} overlap between {j:03d} and {k:03d}\n"
             f"old root: {old_root}, new root: {new_root}"
         )
-        fig.canvas.draw()
+        fig.canvas.draw_idle()
 
     draw(0)
 
@@ -599,7 +799,9 @@ def plot_overlaps(h5, thresh=0.1):
 
 
 def render_cdds(h5):
-    with h5py.File(h5) as handle:
+    from pysisyphus.wrapper.jmol import render_cdd_cube
+
+    with _open_h5(h5) as handle:
         cdd_cubes = handle["cdd_cubes"][:].astype(str)
         orient = handle["orient"][()].decode()
     cdd_cubes = [Path(cub) for cub in cdd_cubes]
@@ -618,17 +820,30 @@ def render_cdds(h5):
 
     # Create list of all final PNG filenames
     png_fns = [Path(cube).with_suffix(".png") for cube in cdd_cubes]
-    # Check which cubes are already rendered
-    png_stems = [png.stem for png in png_fns if png.exists()]
+    # Check which cubes are already rendered. Every directory is only listed
+    # once, instead of checking every PNG on its own.
+    existing_pngs = set()
+    for png_dir in {png.parent for png in png_fns}:
+        existing_pngs.update(png_dir.glob("*.png"))
+    png_stems = {png.stem for png in png_fns if png in existing_pngs}
     print(f"{len(png_stems)} cubes seem already rendered.")
 
     # Only render cubes that are not yet rendered
     cdd_cubes = [cube for cube in cdd_cubes if Path(cube).stem not in png_stems]
     print(f"Rendering {len(cdd_cubes)} CDD cubes.")
 
-    for i, cube in enumerate(cdd_cubes):
-        print(f"Rendering cube {i+1:03d}/{len(cdd_cubes):03d}")
-        _ = render_cdd_cube(cube, orient=orient)
+    # Rendering is done by Jmol in a subprocess, so threads are sufficient to
+    # render several cubes in parallel. Every Jmol instance starts its own JVM,
+    # so only a few are run at once.
+    max_workers = min(4, os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(render_cdd_cube, cube, orient=orient)
+            for cube in cdd_cubes
+        ]
+        for i, future in enumerate(as_completed(futures)):
+            _ = future.result()
+            print(f"Rendered cube {i+1:03d}/{len(cdd_cubes):03d}")
     joined = "\n".join([str(fn) for fn in png_fns])
     with open(CDD_PNG_FNS, "w") as handle:
         handle.write(joined)
@@ -638,12 +853,15 @@ def render_cdds(h5):
 
 
 def plot_afir(h5_fn="afir.h5", h5_group="afir"):
+    import matplotlib.pyplot as plt
+
+    from pysisyphus.peakdetect import peakdetect
 
     h5_fns = (h5_fn, Path(OUT_DIR_DEFAULT) / h5_fn)
     for h5_fn in h5_fns:
         print(f"Trying to open '{h5_fn}' ... ", end="")
         try:
-            with h5py.File(h5_fn, "r") as handle:
+            with _open_h5(h5_fn) as handle:
                 group = handle[h5_group]
                 cycles = group.attrs["cur_cycle"] + 1
                 afir_ens = group["energy"][:cycles]
@@ -658,10 +876,8 @@ def plot_afir(h5_fn="afir.h5", h5_group="afir"):
 
 
     en_conv, en_unit = get_en_conv()
-    afir_ens *= en_conv
-    afir_ens -= afir_ens.min()
-    true_ens *= en_conv
-    true_ens -= true_ens.min()
+    shift_and_scale(afir_ens, en_conv)
+    shift_and_scale(true_ens, en_conv)
     afir_forces = np.linalg.norm(afir_forces, axis=1)
     true_forces = np.linalg.norm(true_forces, axis=1)
 
@@ -732,6 +948,12 @@ def parse_args(args):
     parser.add_argument(
         "--kcal", action="store_true", help="Use kcal mol⁻¹ instead of kJ mol⁻¹."
     )
+    parser.add_argument(
+        "--lazy",
+        action="store_true",
+        help="Read COS coordinates and forces of a cycle only when it is "
+        "plotted, instead of loading all cycles into memory at once.",
+    )
 
     group = parser.add_mutually_exclusive_group(required=True)
     group.add_argument(
@@ -770,7 +992,9 @@ def parse_args(args):
 
 
 def plot_opt(h5_fn="optimization.h5", h5_group="opt"):
-    with h5py.File(h5_fn, "r") as handle:
+    import matplotlib.pyplot as plt
+
+    with _open_h5(h5_fn) as handle:
         try:
             group = handle[h5_group]
         except KeyError:
@@ -791,15 +1015,14 @@ def plot_opt(h5_fn="optimization.h5", h5_group="opt"):
         is_converged = group.attrs["is_converged"]
         coord_type = group.attrs["coord_type"]
 
-        ens = group["energies"][:cur_cycle]
-        max_forces = group["max_forces"][:cur_cycle]
-        rms_forces = group["rms_forces"][:cur_cycle]
+        ens = read_direct(group["energies"], cur_cycle)
+        max_forces = read_direct(group["max_forces"], cur_cycle)
+        rms_forces = read_direct(group["rms_forces"], cur_cycle)
         max_force_thresh = group.attrs["max_force_thresh"]
         rms_force_thresh = group.attrs["rms_force_thresh"]
 
     en_conv, en_unit = get_en_conv()
-    ens -= ens.min()
-    ens *= en_conv
+    shift_and_scale(ens, en_conv)
     if is_cos:
         text = textwrap.wrap(
             "COS optimization detected. Plotting total energy of all images "
@@ -844,6 +1067,8 @@ def plot_opt(h5_fn="optimization.h5", h5_group="opt"):
 
 
 def plot_irc():
+    import matplotlib.pyplot as plt
+
     cwd = Path(".")
     h5s = cwd.glob("*irc_data.h5")
     for h5 in h5s:
@@ -854,11 +1079,13 @@ def plot_irc():
 
 
 def plot_irc_h5(h5, title=None):
+    import matplotlib.pyplot as plt
+
     print(f"Reading IRC data {h5}")
-    with h5py.File(h5, "r") as handle:
-        mw_coords = handle["mw_coords"][:]
-        energies = handle["energies"][:]
-        gradients = handle["gradients"][:]
+    with _open_h5(h5) as handle:
+        mw_coords = handle["mw_coords"]
+        energies = read_direct(handle["energies"])
+        gradients = handle["gradients"]
         rms_grad_thresh = handle["rms_grad_thresh"][()]
 
         try:
@@ -866,18 +1093,26 @@ def plot_irc_h5(h5, title=None):
         except KeyError:
             ts_index = None
 
-    sizes = [dataset.shape[0] for dataset in (mw_coords, energies, gradients)]
-    size0 = sizes[0]
-    assert all([size == size0 for size in sizes])
-    print(f"\tFound {size0} IRC points")
+        sizes = [dataset.shape[0] for dataset in (mw_coords, energies, gradients)]
+        size0 = sizes[0]
+        assert all([size == size0 for size in sizes])
+        print(f"\tFound {size0} IRC points")
+
+        # Only the reduced quantities are kept, so the (potentially large)
+        # coordinate and gradient datasets are streamed in blocks.
+        cds = np.empty(size0)
+        rms_grads = np.empty(size0)
+        max_grads = np.empty(size0)
+        if size0:
+            mw_coords0 = mw_coords[0]
+        for sl, block in iter_row_blocks(mw_coords):
+            cds[sl] = np.linalg.norm(block - mw_coords0, axis=1)
+        for sl, block in iter_row_blocks(gradients):
+            rms_grads[sl] = np.sqrt(np.mean(block ** 2, axis=1))
+            max_grads[sl] = np.abs(block).max(axis=1)
 
     en_conv, en_unit = get_en_conv()
-    energies -= energies[0]
-    energies *= en_conv
-
-    cds = np.linalg.norm(mw_coords - mw_coords[0], axis=1)
-    rms_grads = np.sqrt(np.mean(gradients ** 2, axis=1))
-    max_grads = np.abs(gradients).max(axis=1)
+    shift_and_scale(energies, en_conv, shift=energies[0])
 
     fig, (ax0, ax1, ax2) = plt.subplots(nrows=3, sharex=True)
 
@@ -915,7 +1150,9 @@ def plot_irc_h5(h5, title=None):
 
 
 def plot_scan(h5_fn="scan.h5"):
-    with h5py.File(h5_fn, "r") as handle:
+    import matplotlib.pyplot as plt
+
+    with _open_h5(h5_fn) as handle:
         groups = list()
         energies = list()
         for k in handle.keys():
@@ -924,10 +1161,9 @@ def plot_scan(h5_fn="scan.h5"):
             energies.append(group["energies"][:])
     print(f"Found {len(groups)} groups in '{h5_fn}'.")
 
-    en_conv, _ = get_en_conv
+    en_conv, _ = get_en_conv()
     for group, ens in zip(groups, energies):
-        ens -= ens.min()
-        ens *= en_conv
+        shift_and_scale(ens, en_conv)
         fig, ax = plt.subplots()
         ax.plot(ens, "o-")
         ax.set_xlabel("Scan point")
@@ -938,6 +1174,10 @@ def plot_scan(h5_fn="scan.h5"):
 
 def plot_trj_energies(trj):
     """Parse comments of .xyz/.trj as energies and plot."""
+    import matplotlib.pyplot as plt
+
+    from pysisyphus.io import parse_xyz
+
     atoms_coords, comments = parse_xyz(trj, with_comment=True)
     try:
         energies = np.array(comments, dtype=float)
@@ -945,8 +1185,7 @@ def plot_trj_energies(trj):
         print("Could not convert comments to energies!\n")
         raise err
     en_conv, en_unit = get_en_conv()
-    energies -= energies.min()
-    energies *= en_conv
+    shift_and_scale(energies, en_conv)
     fig, ax = plt.subplots()
     ax.plot(energies)
     highlights = [0, energies.argmax(), energies.size - 1]
@@ -959,7 +1198,7 @@ def plot_trj_energies(trj):
 
 
 def list_h5_groups(h5_fn):
-    with h5py.File(h5_fn, "r") as handle:
+    with _open_h5(h5_fn) as handle:
         groups = list(handle.keys())
 
     print(f"Found {len(groups)} groups in '{h5_fn}'\n")
@@ -1000,7 +1239,7 @@ def run():
         plot_opt(h5_group=args.h5_group)
     # COS specific
     elif args.cosens:
-        plot_cos_energies(h5_group=args.h5_group)
+        plot_cos_energies(h5_group=args.h5_group, lazy=args.lazy)
     elif args.cosforces:
         plot_cos_forces(h5_group=args.h5_group)
     # AFIR
@@ -68,7 +68,9 @@ def render_cdd_cube(cdd_cube, isoval=0.002, orient=""):
         colors="red blue",
         png_fn=png_fn,
     )
-    with open("jmol.spt", "w") as handle:
+    # Keep the script for debugging. Every cube gets its own script file, so
+    # several cubes can be rendered in parallel.
+    with open(png_fn.with_suffix(".spt"), "w") as handle:
         handle.write(spt)
     stdout, stderr = call_jmol(spt)
     return png_fn
@@ -1,8 +1,7 @@
 import logging
 import os
 from pathlib import Path
-import shutil
-from subprocess import PIPE, Popen
+import subprocess
 
 import numpy as np
 
@@ -22,22 +21,26 @@ def wrap_stdin(stdin):
     return f"<< EOF\n{stdin}\nEOF"
 
 
-def call_mwfn(inp_fn, stdin, cwd=None):
+def call_mwfn(inp_fn, stdin, cwd=None, capture_stdout=True):
     if cwd is None:
         cwd = Path(".")
     mwfn_cmd = get_cmd("mwfn")
     cmd = [mwfn_cmd, inp_fn]
     log(f"\n{mwfn_cmd} {inp_fn} {wrap_stdin(stdin)}")
-    proc = Popen(
-        cmd, universal_newlines=True, stdin=PIPE, stdout=PIPE, stderr=PIPE, cwd=cwd
+    result = subprocess.run(
+        cmd,
+        input=stdin.encode(),
+        stdout=subprocess.PIPE if capture_stdout else subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        cwd=cwd,
     )
-    stdout, stderr = proc.communicate(stdin)
+    stdout = result.stdout.decode() if capture_stdout else None
+    stderr = result.stderr.decode()
     if "segmentation fault occurred" in stderr:
         raise SegfaultException(
             "Multiwfn segfaulted! Multiwfn seems to have problems "
             "with systems >= 1000 basis functions. Maybe your system is too big."
         )
-    proc.terminate()
     return stdout, stderr
 
 
@@ -84,7 +87,8 @@ def make_cdd(inp_fn, state, log_fn, cwd=None, keep=False, quality=2, prefix="S")
     0
     q
     """
-    stdout, stderr = call_mwfn(inp_fn, stdin, cwd=cwd)
+    # Multiwfn's output is not needed here, so stdout is not captured.
+    _, stderr = call_mwfn(inp_fn, stdin, cwd=cwd, capture_stdout=False)
 
     if cwd is None:
         cwd = "."
@@ -103,8 +107,7 @@ def make_cdd(inp_fn, state, log_fn, cwd=None, keep=False, quality=2, prefix="S")
         root, ext = os.path.splitext(fn)
         new_path = cwd / f"{prefix}_{state:03d}_{root}{ext}"
         try:
-            shutil.copy(old_path, new_path)
-            os.remove(old_path)
+            os.replace(old_path, new_path)
             new_paths.append(new_path)
         except FileNotFoundError:
             pass
@@ -118,32 +121,31 @@ def get_mwfn_exc_str(energies, ci_coeffs, dexc_ci_coeffs=None, thresh=1e-3):
     # states, occ, virt
     _, occ_mos, _ = ci_coeffs.shape
 
-    exc_str = ""
+    exc_strs = list()
     mult = 1
     log(f"Using dummy multiplicity={mult} in get_mwfn_exc_str")
     if dexc_ci_coeffs is None:
         dexc_ci_coeffs = [None] * ci_coeffs.shape[0]
 
     def get_exc_lines(ci_coeffs, arrow):
-        exc_lines = list()
-        for (occ, virt), coeff in np.ndenumerate(ci_coeffs):
-            if abs(coeff) < thresh:
-                continue
-            occ_mo = occ + 1
-            virt_mo = occ_mos + 1 + virt
-            exc_line = f"{occ_mo:>8d} {arrow} {virt_mo}       {coeff: .5f}"
-            exc_lines.append(exc_line)
+        # Only format the (usually few) coefficients above the threshold.
+        inds = np.argwhere(np.abs(ci_coeffs) >= thresh)
+        coeffs = ci_coeffs[inds[:, 0], inds[:, 1]]
+        exc_lines = [
+            f"{occ+1:>8d} {arrow} {occ_mos+1+virt}       {coeff: .5f}"
+            for (occ, virt), coeff in zip(inds.tolist(), coeffs)
+        ]
         return exc_lines
 
     for root_, (root_ci_coeffs, root_dexc_ci_coeffs, exc_en) in enumerate(
         zip(ci_coeffs, dexc_ci_coeffs, exc_energies), 1
     ):
-        exc_str += f"Excited State {root_} {mult} {exc_en:.4f}\n"
+        exc_strs.append(f"Excited State {root_} {mult} {exc_en:.4f}\n")
         # Excitations (X vector)
         exc_lines = get_exc_lines(root_ci_coeffs, "->")
         # De-Excitations (Y vector), if present
         if root_dexc_ci_coeffs is not None:
             exc_lines += get_exc_lines(root_dexc_ci_coeffs, "<-")
-        exc_str += "\n".join(exc_lines)
-        exc_str += "\n\n"
-    return exc_str
+        exc_strs.append("\n".join(exc_lines))
+        exc_strs.append("\n\n")
+    return "".join(exc_strs)
@@ -65,3 +65,46 @@ def test_anapot_bond_sets():
     geom = AnaPot().get_minima()[0]
     bond_sets = geom.bond_sets
     assert len(bond_sets) == 0
+
+
+def test_results_cache():
+    geom = AnaPot().get_minima()[0]
+    calc = geom.calculator
+    energy = geom.energy
+    forces = geom.forces
+    energy_calcs = calc.energy_calcs
+    # Results are cached
+    assert geom.energy == energy
+    np.testing.assert_allclose(geom.forces, forces)
+    assert calc.energy_calcs == energy_calcs
+    assert calc.forces_calcs == 1
+
+    # In-place modification of the coordinates invalidates the results
+    geom.coords3d[0, 0] += 0.1
+    assert geom.energy != pytest.approx(energy)
+    assert calc.energy_calcs == energy_calcs + 1
+
+    # Setting identical coordinates keeps the results
+    energy = geom.energy
+    energy_calcs = calc.energy_calcs
+    geom.coords = geom.coords.copy()
+    assert geom.energy == energy
+    assert calc.energy_calcs == energy_calcs
+
+
+def test_results_cache_partial_set():
+    geom = AnaPot().get_minima()[0]
+    energy = geom.energy
+    hessian = geom.cart_hessian
+    calc = geom.calculator
+    energy_calcs = calc.energy_calcs
+
+    # In-place modification, followed by setting only the forces must not
+    # revalidate the stale energy and Hessian.
+    geom.coords3d[0, 0] += 0.1
+    forces = np.ones_like(geom.cart_coords)
+    geom.cart_forces = forces
+    np.testing.assert_allclose(geom.cart_forces, forces)
+    assert geom.energy != pytest.approx(energy)
+    assert calc.energy_calcs == energy_calcs + 1
+    assert not np.allclose(geom.cart_hessian, hessian)
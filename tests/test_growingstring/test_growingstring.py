@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 
 from pysisyphus.calculators.AnaPot import AnaPot
@@ -198,3 +199,15 @@ def test_climb_lanczos():
 
     assert opt.is_converged
     assert opt.cur_cycle == 23
+
+
+@pytest.mark.parametrize("max_nodes", (2, 9))
+def test_vectorized_tangents(max_nodes):
+    calc = AnaPot()
+    geoms = calc.get_path(num=2)
+    gs = GrowingString(geoms, lambda: AnaPot(), max_nodes=max_nodes)
+    gs.calculate_forces()
+
+    tangents = gs.get_tangents()
+    ref_tangents = [gs.get_tangent(i) for i in range(len(gs.images))]
+    np.testing.assert_allclose(tangents, ref_tangents)
@@ -1,17 +1,41 @@
+import dataclasses
+import functools
+
+import numpy as np
 import pytest
 from rmsd import kabsch_rmsd
 
 from pysisyphus.constants import ANG2BOHR as AB
 from pysisyphus.helpers import geom_loader
-from pysisyphus.io.zmat import geom_from_zmat, zmat_from_fn, ZLine
+from pysisyphus.io.zmat import (
+    build_specialized,
+    coords3d_from_zmat,
+    coords3d_from_zmat_batch,
+    geom_from_zmat,
+    zmat_from_fn,
+    zmat_from_str,
+    ZLine,
+    ZMat,
+    ZMatCache,
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _ref_coords(fn):
+    """Centered reference coordinates, loaded only once per file."""
+    c3d = geom_loader(fn).coords3d
+    c3d = c3d - c3d.mean(axis=0)
+    c3d.flags.writeable = False
+    return c3d
 
 
 def assert_geom(ref_fn, zmat_fn, atol=2.5e-5):
     zmat = zmat_from_fn(zmat_fn)
     geom = geom_from_zmat(zmat)
 
-    ref = geom_loader(ref_fn)
-    rmsd = kabsch_rmsd(geom.coords3d, ref.coords3d, translate=True)
+    c3d = geom.coords3d
+    # The cached reference is already centered
+    rmsd = kabsch_rmsd(c3d - c3d.mean(axis=0), _ref_coords(ref_fn))
     print(f"RMSD: {rmsd:.6f}")
     assert rmsd == pytest.approx(0., abs=atol)
 
@@ -35,3 +59,83 @@ def test_geom_from_zmat(this_dir):
     reference = geom_loader(this_dir / "glycine_noh.xyz")
     rmsd = kabsch_rmsd(geom.coords3d, reference.coords3d, translate=True)
     assert rmsd == pytest.approx(0., abs=1e-6)
+
+
+def test_coords3d_from_zmat_batch(this_dir):
+    zmat = ZMat.from_fn(this_dir / "glycine_resorted.zmat")
+    rng = np.random.default_rng(20221018)
+    batch_size = 4
+    r = zmat.r + rng.uniform(-0.1, 0.1, size=(batch_size, len(zmat)))
+    a = zmat.a + rng.uniform(-5.0, 5.0, size=(batch_size, len(zmat)))
+    d = zmat.d + rng.uniform(-30.0, 30.0, size=(batch_size, len(zmat)))
+
+    coords3d = coords3d_from_zmat_batch(zmat, r, a, d, dtype=np.float64)
+    assert coords3d.shape == (batch_size, len(zmat), 3)
+    coords3d_sp = coords3d_from_zmat_batch(zmat, r, a, d)
+    assert coords3d_sp.dtype == np.float32
+    np.testing.assert_allclose(coords3d_sp, coords3d, atol=1e-4)
+    for coords3d_, r_, a_, d_ in zip(coords3d, r, a, d):
+        zmat_ = dataclasses.replace(zmat, r=r_, a=a_, d=d_)
+        geom = geom_from_zmat(zmat_, drop_dummy=False)
+        np.testing.assert_allclose(coords3d_, geom.coords3d, atol=1e-12)
+
+
+def test_coords3d_from_zmat(this_dir):
+    zmat = ZMat.from_fn(this_dir / "glycine_resorted.zmat")
+    coords3d = coords3d_from_zmat(zmat)
+    geom = geom_from_zmat(zmat, drop_dummy=False)
+    np.testing.assert_allclose(coords3d, geom.coords3d)
+
+
+def test_zmat_cache(this_dir):
+    zmat = ZMat.from_fn(this_dir / "glycine_resorted.zmat")
+    cache = ZMatCache(zmat)
+    np.testing.assert_allclose(cache.coords3d, coords3d_from_zmat(zmat))
+
+    ind = len(zmat) - 3
+    new_d = zmat.d[ind] + 35.0
+    new_r = zmat.r[-1] + 0.1
+    coords3d = cache.update({ind: {"d": new_d}, len(zmat) - 1: {"r": new_r}})
+    assert cache.last_changed_i == ind
+
+    d = zmat.d.copy()
+    d[ind] = new_d
+    r = zmat.r.copy()
+    r[-1] = new_r
+    ref_coords3d = coords3d_from_zmat(dataclasses.replace(zmat, r=r, d=d))
+    np.testing.assert_allclose(coords3d, ref_coords3d, atol=1e-12)
+    # Atoms before the changed index are unaffected
+    np.testing.assert_allclose(coords3d[:ind], coords3d_from_zmat(zmat)[:ind])
+
+
+def test_build_specialized(this_dir):
+    zmat = ZMat.from_fn(this_dir / "glycine_resorted.zmat")
+    kernel = build_specialized(zmat)
+    # Same topology, different values reuse the kernel
+    zmat_ = dataclasses.replace(zmat, d=zmat.d + 10.0)
+    assert build_specialized(zmat_) is kernel
+
+    for zm in (zmat, zmat_):
+        coords3d = kernel(
+            zm.r, np.deg2rad(zm.a), np.deg2rad(zm.d), np.zeros((len(zm), 3))
+        )
+        np.testing.assert_allclose(coords3d, coords3d_from_zmat(zm), atol=1e-12)
+
+
+def test_zmat_from_str():
+    zmat = zmat_from_str(
+        """
+        C
+        O 1 1.2
+        # Comment
+        H 2 1.0 1 100.0
+        """
+    )
+    assert zmat == [
+        ZLine("C"),
+        ZLine("O", 0, 1.2 * AB),
+        ZLine("H", 1, 1.0 * AB, 0, 100.0),
+    ]
+    # Atom index without a value
+    with pytest.raises(AssertionError):
+        zmat_from_str("C\nO 1")